@@ -1,3 +1,5 @@
+import os
+from functools import lru_cache
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
@@ -20,16 +22,22 @@ from app.database.models import Base
 target_metadata = Base.metadata
 
 
+ASYNC_DRIVER_PREFIX = "postgresql+asyncpg://"
+SYNC_DRIVER_PREFIX = "postgresql+psycopg2://"
+
+
+@lru_cache(maxsize=1)
 def get_url():
     """Get database URL from environment variable or config.
 
     Alembic runs synchronously, so we must replace the async driver
     (asyncpg) with a synchronous one (psycopg2) if present.
+    The URL is resolved once per process.
     """
-    import os
     url = os.getenv("DATABASE_URL", config.get_main_option("sqlalchemy.url"))
     # Replace async driver with sync for Alembic
-    url = url.replace("postgresql+asyncpg://", "postgresql+psycopg2://")
+    if url.startswith(ASYNC_DRIVER_PREFIX):
+        url = SYNC_DRIVER_PREFIX + url[len(ASYNC_DRIVER_PREFIX):]
     return url
 
 
@@ -40,6 +48,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -53,15 +62,24 @@ def run_migrations_online() -> None:
         "sqlalchemy.url": db_url,
     }
 
+    # A single pooled connection is reused for the whole run (and checked
+    # before reuse) instead of reconnecting on every checkout
     connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        poolclass=pool.QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=True,
     )
 
     with connectable.connect() as connection:
+        # One transaction per revision so revisions can step out into an
+        # autocommit block for CREATE INDEX CONCURRENTLY
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            transaction_per_migration=True,
         )
 
         with context.begin_transaction():
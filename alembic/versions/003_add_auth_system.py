@@ -51,8 +51,6 @@ def upgrade() -> None:
         sa.Column('last_login_at', sa.DateTime(timezone=True), nullable=True),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_users_id', 'users', ['id'])
-    op.create_index('ix_users_email', 'users', ['email'], unique=True)
 
     # ============================================================
     # Create organizations table
@@ -67,8 +65,6 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), onupdate=sa.text('now()')),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_organizations_id', 'organizations', ['id'])
-    op.create_index('ix_organizations_slug', 'organizations', ['slug'], unique=True)
 
     # ============================================================
     # Create memberships table (user-organization junction)
@@ -91,9 +87,6 @@ def upgrade() -> None:
             name='ck_memberships_valid_role'
         )
     )
-    op.create_index('ix_memberships_id', 'memberships', ['id'])
-    op.create_index('ix_memberships_user_id', 'memberships', ['user_id'])
-    op.create_index('ix_memberships_organization_id', 'memberships', ['organization_id'])
 
     # ============================================================
     # Create sessions table (JWT token tracking)
@@ -113,10 +106,19 @@ def upgrade() -> None:
         sa.UniqueConstraint('token_jti', name='uq_sessions_token_jti'),
         sa.UniqueConstraint('refresh_token_jti', name='uq_sessions_refresh_token_jti')
     )
-    op.create_index('ix_sessions_id', 'sessions', ['id'])
-    op.create_index('ix_sessions_user_id', 'sessions', ['user_id'])
-    op.create_index('ix_sessions_token_jti', 'sessions', ['token_jti'])
-    op.create_index('ix_sessions_organization_id', 'sessions', ['organization_id'])
+
+    # ============================================================
+    # Indexes for the new tables (one batched DDL round-trip)
+    # ============================================================
+    op.execute("""
+        CREATE UNIQUE INDEX ix_users_email ON users (email);
+        CREATE UNIQUE INDEX ix_organizations_slug ON organizations (slug);
+        CREATE INDEX ix_memberships_user_id ON memberships (user_id);
+        CREATE INDEX ix_memberships_organization_id ON memberships (organization_id);
+        CREATE INDEX ix_sessions_user_id ON sessions (user_id);
+        CREATE INDEX ix_sessions_token_jti ON sessions (token_jti);
+        CREATE INDEX ix_sessions_organization_id ON sessions (organization_id);
+    """)
 
     # ============================================================
     # Extend dialogs table for organization ownership
@@ -126,10 +128,8 @@ def upgrade() -> None:
     op.add_column('dialogs', sa.Column('owner_id', UUID(as_uuid=True), nullable=True))
     op.add_column('dialogs', sa.Column('created_by', UUID(as_uuid=True), nullable=True))
 
-    # Add indexes for the new columns
-    op.create_index('ix_dialogs_owner_type', 'dialogs', ['owner_type'])
-    op.create_index('ix_dialogs_owner_id', 'dialogs', ['owner_id'])
-    op.create_index('ix_dialogs_created_by', 'dialogs', ['created_by'])
+    # Indexes for the new columns are built concurrently by
+    # 017_dialogs_ownership_indexes, outside this transaction
 
     # Add check constraint for valid owner_type values
     op.execute("""
@@ -138,14 +138,15 @@ def upgrade() -> None:
         CHECK (owner_type IS NULL OR owner_type IN ('organization', 'user'))
     """)
 
+    # Refresh planner statistics for the new tables/columns right away
+    # instead of waiting for autovacuum
+    op.execute("ANALYZE users, organizations, memberships, sessions, dialogs")
+
 
 def downgrade() -> None:
     # ============================================================
     # Remove dialogs extensions
     # ============================================================
-    op.drop_index('ix_dialogs_created_by', table_name='dialogs')
-    op.drop_index('ix_dialogs_owner_id', table_name='dialogs')
-    op.drop_index('ix_dialogs_owner_type', table_name='dialogs')
     op.execute("ALTER TABLE dialogs DROP CONSTRAINT IF EXISTS ck_dialogs_owner_type")
     op.drop_column('dialogs', 'created_by')
     op.drop_column('dialogs', 'owner_id')
@@ -157,7 +158,6 @@ def downgrade() -> None:
     op.drop_index('ix_sessions_organization_id', table_name='sessions')
     op.drop_index('ix_sessions_token_jti', table_name='sessions')
     op.drop_index('ix_sessions_user_id', table_name='sessions')
-    op.drop_index('ix_sessions_id', table_name='sessions')
     op.drop_table('sessions')
 
     # ============================================================
@@ -165,19 +165,16 @@ def downgrade() -> None:
     # ============================================================
     op.drop_index('ix_memberships_organization_id', table_name='memberships')
     op.drop_index('ix_memberships_user_id', table_name='memberships')
-    op.drop_index('ix_memberships_id', table_name='memberships')
     op.drop_table('memberships')
 
     # ============================================================
     # Drop organizations table
     # ============================================================
     op.drop_index('ix_organizations_slug', table_name='organizations')
-    op.drop_index('ix_organizations_id', table_name='organizations')
     op.drop_table('organizations')
 
     # ============================================================
     # Drop users table
     # ============================================================
     op.drop_index('ix_users_email', table_name='users')
-    op.drop_index('ix_users_id', table_name='users')
     op.drop_table('users')
@@ -5,7 +5,7 @@ Revision ID: 004_username_org_code
 Revises: 003_add_auth_system
 Create Date: 2026-02-19 23:30:00
 """
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
@@ -15,6 +15,9 @@ down_revision = '003_add_auth_system'
 branch_labels = None
 depends_on = None
 
+# Server-side backfill passes before giving up on access code collisions
+ACCESS_CODE_BACKFILL_PASSES = 3
+
 
 def upgrade():
     """Add username and organization access_code fields."""
@@ -44,31 +47,48 @@ def upgrade():
         sa.Column('access_code', sa.String(20), nullable=True)
     )
 
-    # Generate access codes for existing organizations
-    import hashlib
-    import uuid
-
-    # Get all organizations without access code
-    orgs = op.get_bind().execute(
-        sa.text("SELECT id, slug FROM organizations WHERE access_code IS NULL")
-    ).fetchall()
-    
-    for org_id, slug in orgs:
-        # Generate unique 6-character code
-        while True:
-            code = ''.join(c for c in hashlib.md5(f"{slug}{org_id}{uuid.uuid4()}".encode()).hexdigest()[:6].upper() if c.isalnum())
-            if len(code) == 6:
-                # Check uniqueness
-                existing = op.get_bind().execute(
-                    sa.text("SELECT id FROM organizations WHERE access_code = :code"),
-                    {"code": code}
-                ).fetchone()
-                if not existing:
-                    op.get_bind().execute(
-                        sa.text("UPDATE organizations SET access_code = :code WHERE id = :id"),
-                        {"code": code, "id": str(org_id)}
-                    )
-                    break
+    # Create the unique index before the backfill (NULLs do not conflict),
+    # so the collision probe below is a single unique-index lookup
+    op.create_index('ix_organizations_access_code', 'organizations', ['access_code'], unique=True)
+
+    # Generate access codes for existing organizations server-side in one
+    # statement per pass. Candidates that collide with an existing code or
+    # with each other are left NULL and retried on the next pass, so the
+    # UPDATE never trips the unique index.
+    bind = op.get_bind()
+    for _ in range(ACCESS_CODE_BACKFILL_PASSES):
+        op.execute("""
+            WITH candidates AS (
+                SELECT id,
+                       upper(substr(md5(slug || id::text || gen_random_uuid()::text), 1, 6)) AS code
+                FROM organizations
+                WHERE access_code IS NULL
+            ),
+            unique_candidates AS (
+                SELECT DISTINCT ON (c.code) c.id, c.code
+                FROM candidates c
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM organizations o WHERE o.access_code = c.code
+                )
+                ORDER BY c.code, c.id
+            )
+            UPDATE organizations o
+            SET access_code = u.code
+            FROM unique_candidates u
+            WHERE o.id = u.id
+        """)
+        if context.is_offline_mode():
+            break
+
+        remaining = bind.execute(
+            sa.text("SELECT count(*) FROM organizations WHERE access_code IS NULL")
+        ).scalar()
+        if not remaining:
+            break
+    else:
+        raise RuntimeError(
+            f"Could not assign unique access codes to {remaining} organizations"
+        )
 
     # Now make column non-nullable
     op.alter_column('organizations',
@@ -76,9 +96,6 @@ def upgrade():
         nullable=False
     )
 
-    # Create unique index
-    op.create_index('ix_organizations_access_code', 'organizations', ['access_code'], unique=True)
-
 
 def downgrade():
     """Remove username and organization access_code fields."""
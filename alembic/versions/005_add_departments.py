@@ -9,6 +9,8 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
+from app.database.migrations import create_index_concurrently
+
 revision = '005_add_departments'
 down_revision = '004_username_org_code'
 branch_labels = None
@@ -33,18 +35,19 @@ def upgrade():
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
     )
 
-    op.add_column('memberships',
-        sa.Column('department_id', postgresql.UUID(as_uuid=True), nullable=True)
-    )
+    # Column and FK in a single ALTER TABLE (one lock on memberships)
+    op.execute("""
+        ALTER TABLE memberships
+        ADD COLUMN department_id uuid,
+        ADD CONSTRAINT fk_memberships_department_id
+            FOREIGN KEY (department_id) REFERENCES departments (id) ON DELETE SET NULL
+    """)
 
-    op.create_foreign_key(
-        'fk_memberships_department_id',
-        'memberships', 'departments',
-        ['department_id'], ['id'],
-        ondelete='SET NULL'
-    )
+    # Most memberships have no department - index only assigned ones
+    create_index_concurrently('ix_memberships_department_id', 'memberships', ['department_id'],
+                              where='department_id IS NOT NULL')
 
-    op.create_index('ix_memberships_department_id', 'memberships', ['department_id'])
+    op.execute("ANALYZE departments, memberships")
 
 
 def downgrade():
@@ -18,8 +18,8 @@ def upgrade():
     inspector = inspect(bind)
 
     if 'companies' in inspector.get_table_names():
-        existing_cols = [c['name'] for c in inspector.get_columns('companies')]
-        if 'responsible' not in existing_cols:
+        companies_cols = frozenset(c['name'] for c in inspector.get_columns('companies'))
+        if 'responsible' not in companies_cols:
             op.add_column('companies', sa.Column('responsible', sa.String(255), nullable=True,
                                                   comment='Responsible seller name'))
 
@@ -29,6 +29,6 @@ def downgrade():
     inspector = inspect(bind)
 
     if 'companies' in inspector.get_table_names():
-        existing_cols = [c['name'] for c in inspector.get_columns('companies')]
-        if 'responsible' in existing_cols:
+        companies_cols = frozenset(c['name'] for c in inspector.get_columns('companies'))
+        if 'responsible' in companies_cols:
             op.drop_column('companies', 'responsible')
@@ -0,0 +1,55 @@
+"""
+Store owner_type as a native PostgreSQL enum.
+
+Revision ID: 008_owner_type_enum
+Revises: 007_add_company_responsible
+Create Date: 2026-10-15
+
+dialogs, companies and csv_import_mappings.owner_type move from
+VARCHAR(50) + CHECK to the owner_kind enum (4-byte values, integer
+comparisons in the owner_type indexes). The column rewrite takes an
+ACCESS EXCLUSIVE lock on each table for the duration of the rewrite.
+"""
+from alembic import op
+
+revision = '008_owner_type_enum'
+down_revision = '007_add_company_responsible'
+branch_labels = None
+depends_on = None
+
+OWNER_TYPE_TABLES = ('dialogs', 'companies', 'csv_import_mappings')
+
+
+def upgrade():
+    """Convert owner_type columns to the owner_kind enum."""
+    op.execute("CREATE TYPE owner_kind AS ENUM ('organization', 'user')")
+
+    # The enum enforces the allowed values now
+    op.execute("ALTER TABLE dialogs DROP CONSTRAINT IF EXISTS ck_dialogs_owner_type")
+
+    for table in OWNER_TYPE_TABLES:
+        op.execute(f"""
+            ALTER TABLE {table}
+            ALTER COLUMN owner_type TYPE owner_kind
+            USING owner_type::owner_kind
+        """)
+
+    op.execute(f"ANALYZE {', '.join(OWNER_TYPE_TABLES)}")
+
+
+def downgrade():
+    """Convert owner_type columns back to VARCHAR(50)."""
+    for table in OWNER_TYPE_TABLES:
+        op.execute(f"""
+            ALTER TABLE {table}
+            ALTER COLUMN owner_type TYPE VARCHAR(50)
+            USING owner_type::text
+        """)
+
+    op.execute("""
+        ALTER TABLE dialogs
+        ADD CONSTRAINT ck_dialogs_owner_type
+        CHECK (owner_type IS NULL OR owner_type IN ('organization', 'user'))
+    """)
+
+    op.execute("DROP TYPE owner_kind")
@@ -0,0 +1,39 @@
+"""
+Drop ix_*_id indexes that duplicate primary key indexes.
+
+Revision ID: 009_drop_redundant_pk_indexes
+Revises: 008_owner_type_enum
+Create Date: 2026-10-15
+
+003 no longer creates these indexes; this revision removes them from
+databases that were migrated before that change.
+"""
+from alembic import op
+
+from app.database.migrations import create_index_concurrently
+
+revision = '009_drop_redundant_pk_indexes'
+down_revision = '008_owner_type_enum'
+branch_labels = None
+depends_on = None
+
+# index name -> table
+REDUNDANT_PK_INDEXES = {
+    'ix_users_id': 'users',
+    'ix_organizations_id': 'organizations',
+    'ix_memberships_id': 'memberships',
+    'ix_sessions_id': 'sessions',
+}
+
+
+def upgrade():
+    """Drop the duplicate id indexes without blocking writes."""
+    with op.get_context().autocommit_block():
+        for name in REDUNDANT_PK_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade():
+    """Recreate the id indexes."""
+    for name, table in REDUNDANT_PK_INDEXES.items():
+        create_index_concurrently(name, table, ['id'])
@@ -0,0 +1,26 @@
+"""
+Add a partial index for listing active departments by name.
+
+Revision ID: 010_department_listing_index
+Revises: 009_drop_redundant_pk_indexes
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+from app.database.migrations import create_index_concurrently
+
+revision = '010_department_listing_index'
+down_revision = '009_drop_redundant_pk_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Index active departments by organization in name order."""
+    create_index_concurrently('ix_departments_organization_id_name_active', 'departments',
+                              ['organization_id', 'name'], where='is_active')
+
+
+def downgrade():
+    """Drop the department listing index."""
+    op.drop_index('ix_departments_organization_id_name_active', table_name='departments')
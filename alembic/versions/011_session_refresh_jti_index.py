@@ -0,0 +1,27 @@
+"""
+Add a partial index on active sessions by refresh token JTI.
+
+Revision ID: 011_session_refresh_jti_index
+Revises: 010_department_listing_index
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+from app.database.migrations import create_index_concurrently
+
+revision = '011_session_refresh_jti_index'
+down_revision = '010_department_listing_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Index active sessions by refresh token JTI for token refresh."""
+    create_index_concurrently('ix_sessions_refresh_token_jti', 'sessions',
+                              ['refresh_token_jti'],
+                              where='is_active AND refresh_token_jti IS NOT NULL')
+
+
+def downgrade():
+    """Drop the refresh token JTI index."""
+    op.drop_index('ix_sessions_refresh_token_jti', table_name='sessions')
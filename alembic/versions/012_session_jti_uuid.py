@@ -0,0 +1,35 @@
+"""
+Store session token JTIs as native UUIDs.
+
+JTIs are generated with uuid4(), so the VARCHAR(255) values convert
+losslessly. The ALTER rewrites the sessions table and its indexes.
+
+Revision ID: 012_session_jti_uuid
+Revises: 011_session_refresh_jti_index
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = '012_session_jti_uuid'
+down_revision = '011_session_refresh_jti_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Convert token_jti and refresh_token_jti to uuid in one table rewrite."""
+    op.execute("""
+        ALTER TABLE sessions
+            ALTER COLUMN token_jti TYPE uuid USING token_jti::uuid,
+            ALTER COLUMN refresh_token_jti TYPE uuid USING refresh_token_jti::uuid
+    """)
+    op.execute("ANALYZE sessions")
+
+
+def downgrade():
+    """Convert the JTI columns back to VARCHAR(255)."""
+    op.execute("""
+        ALTER TABLE sessions
+            ALTER COLUMN token_jti TYPE VARCHAR(255) USING token_jti::text,
+            ALTER COLUMN refresh_token_jti TYPE VARCHAR(255) USING refresh_token_jti::text
+    """)
@@ -0,0 +1,54 @@
+"""
+Store membership roles as a native PostgreSQL enum.
+
+Revision ID: 013_membership_role_enum
+Revises: 012_session_jti_uuid
+Create Date: 2026-10-15
+
+memberships.role moves from VARCHAR(50) + CHECK to the user_role enum.
+The column rewrite takes an ACCESS EXCLUSIVE lock on memberships and
+rebuilds its indexes.
+"""
+from alembic import op
+
+revision = '013_membership_role_enum'
+down_revision = '012_session_jti_uuid'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Convert memberships.role to the user_role enum."""
+    op.execute("CREATE TYPE user_role AS ENUM ('owner', 'admin', 'member', 'viewer')")
+
+    # The enum enforces the allowed values now
+    op.execute("ALTER TABLE memberships DROP CONSTRAINT IF EXISTS ck_memberships_valid_role")
+
+    # The VARCHAR default cannot be cast automatically, so it is dropped
+    # and restored around the type change
+    op.execute("""
+        ALTER TABLE memberships
+            ALTER COLUMN role DROP DEFAULT,
+            ALTER COLUMN role TYPE user_role USING role::user_role,
+            ALTER COLUMN role SET DEFAULT 'member'
+    """)
+
+    op.execute("ANALYZE memberships")
+
+
+def downgrade():
+    """Convert memberships.role back to VARCHAR(50)."""
+    op.execute("""
+        ALTER TABLE memberships
+            ALTER COLUMN role DROP DEFAULT,
+            ALTER COLUMN role TYPE VARCHAR(50) USING role::text,
+            ALTER COLUMN role SET DEFAULT 'member'
+    """)
+
+    op.execute("""
+        ALTER TABLE memberships
+        ADD CONSTRAINT ck_memberships_valid_role
+        CHECK (role IN ('owner', 'admin', 'member', 'viewer'))
+    """)
+
+    op.execute("DROP TYPE user_role")
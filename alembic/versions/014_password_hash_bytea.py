@@ -0,0 +1,34 @@
+"""
+Store bcrypt password hashes as raw bytes.
+
+Revision ID: 014_password_hash_bytea
+Revises: 013_membership_role_enum
+Create Date: 2026-10-15
+
+bcrypt hashes are 60 ASCII bytes; storing them as bytea lets the
+application pass them to bcrypt without an encode/decode per check.
+"""
+from alembic import op
+
+revision = '014_password_hash_bytea'
+down_revision = '013_membership_role_enum'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Convert users.password_hash from VARCHAR to bytea."""
+    op.execute("""
+        ALTER TABLE users
+        ALTER COLUMN password_hash TYPE bytea
+        USING convert_to(password_hash, 'UTF8')
+    """)
+
+
+def downgrade():
+    """Convert users.password_hash back to VARCHAR(255)."""
+    op.execute("""
+        ALTER TABLE users
+        ALTER COLUMN password_hash TYPE VARCHAR(255)
+        USING convert_from(password_hash, 'UTF8')
+    """)
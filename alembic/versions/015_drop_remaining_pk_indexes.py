@@ -0,0 +1,41 @@
+"""
+Drop the remaining duplicate indexes on primary key columns.
+
+Revision ID: 015_drop_remaining_pk_indexes
+Revises: 014_password_hash_bytea
+Create Date: 2026-10-15
+
+Follow-up to 009 for the non-auth tables and departments. Each primary
+key already provides a unique index on id. ix_departments_id and
+ix_companies_id only exist on databases bootstrapped with
+metadata.create_all(), hence IF EXISTS.
+"""
+from alembic import op
+
+from app.database.migrations import create_index_concurrently
+
+revision = '015_drop_remaining_pk_indexes'
+down_revision = '014_password_hash_bytea'
+branch_labels = None
+depends_on = None
+
+REDUNDANT_PK_INDEXES = {
+    'ix_dialogs_id': 'dialogs',
+    'ix_transcriptions_id': 'transcriptions',
+    'ix_dialog_analyses_id': 'dialog_analyses',
+    'ix_companies_id': 'companies',
+    'ix_departments_id': 'departments',
+}
+
+
+def upgrade():
+    """Drop the duplicate id indexes without blocking writes."""
+    with op.get_context().autocommit_block():
+        for name in REDUNDANT_PK_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade():
+    """Recreate the id indexes."""
+    for name, table in REDUNDANT_PK_INDEXES.items():
+        create_index_concurrently(name, table, ['id'])
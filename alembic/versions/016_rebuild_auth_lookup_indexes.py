@@ -0,0 +1,59 @@
+"""
+Rebuild the membership and session lookup indexes as partial covering indexes.
+
+Revision ID: 016_rebuild_auth_lookup_indexes
+Revises: 015_drop_remaining_pk_indexes
+Create Date: 2026-10-15
+
+003 creates plain full-table indexes on memberships (user_id),
+(organization_id) and sessions (user_id), (token_jti). Every lookup that
+uses them filters on is_active, so they are rebuilt as partial indexes
+on active rows. The membership checks and per-request session
+validation read a few more columns, which the indexes INCLUDE, so those
+lookups become index-only scans. Each index is rebuilt concurrently
+under its existing name.
+
+Also adds ix_sessions_expires_at for expired-session cleanup. It is not
+partial: cleanup_expired_sessions deletes revoked sessions too.
+"""
+from alembic import op
+
+from app.database.migrations import create_index_concurrently, rebuild_index_concurrently
+
+revision = '016_rebuild_auth_lookup_indexes'
+down_revision = '015_drop_remaining_pk_indexes'
+branch_labels = None
+depends_on = None
+
+# index name -> (table, columns, INCLUDE columns)
+ACTIVE_LOOKUP_INDEXES = {
+    'ix_memberships_user_id': (
+        'memberships', ['user_id'], ['organization_id', 'role', 'is_active']
+    ),
+    'ix_memberships_organization_id': (
+        'memberships', ['organization_id'], ['user_id', 'role', 'is_active']
+    ),
+    'ix_sessions_user_id': (
+        'sessions', ['user_id'], None
+    ),
+    'ix_sessions_token_jti': (
+        'sessions', ['token_jti'], ['user_id', 'organization_id', 'expires_at', 'is_active']
+    ),
+}
+
+
+def upgrade():
+    """Replace the full lookup indexes with partial covering ones."""
+    for name, (table, columns, include) in ACTIVE_LOOKUP_INDEXES.items():
+        rebuild_index_concurrently(name, table, columns, where='is_active', include=include)
+
+    create_index_concurrently('ix_sessions_expires_at', 'sessions', ['expires_at'])
+
+
+def downgrade():
+    """Restore the full lookup indexes created by 003."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_sessions_expires_at")
+
+    for name, (table, columns, _) in ACTIVE_LOOKUP_INDEXES.items():
+        rebuild_index_concurrently(name, table, columns)
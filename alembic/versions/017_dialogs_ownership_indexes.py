@@ -0,0 +1,41 @@
+"""
+Index the dialogs ownership columns added by 003.
+
+Revision ID: 017_dialogs_ownership_indexes
+Revises: 016_rebuild_auth_lookup_indexes
+Create Date: 2026-10-15
+
+dialogs is a pre-existing, write-heavy table, so the indexes are built
+with CREATE INDEX CONCURRENTLY. That needs an autocommit block, which
+would commit 003 halfway if run there, so the builds live in their own
+revision. Databases migrated before this split already have the indexes
+and the IF NOT EXISTS builds are no-ops.
+"""
+from alembic import op
+
+from app.database.migrations import create_index_concurrently
+
+revision = '017_dialogs_ownership_indexes'
+down_revision = '016_rebuild_auth_lookup_indexes'
+branch_labels = None
+depends_on = None
+
+# index name -> column
+OWNERSHIP_INDEXES = {
+    'ix_dialogs_owner_type': 'owner_type',
+    'ix_dialogs_owner_id': 'owner_id',
+    'ix_dialogs_created_by': 'created_by',
+}
+
+
+def upgrade():
+    """Build the ownership indexes without blocking writes to dialogs."""
+    for name, column in OWNERSHIP_INDEXES.items():
+        create_index_concurrently(name, 'dialogs', [column])
+
+
+def downgrade():
+    """Drop the ownership indexes."""
+    with op.get_context().autocommit_block():
+        for name in OWNERSHIP_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -2,6 +2,8 @@
 Authentication and Authorization Module.
 """
 
+import importlib
+
 # Models can be imported directly
 from .models import User, Organization, Membership, Session, UserRole
 
@@ -14,29 +16,32 @@ __all__ = [
     "UserRole",
 ]
 
+# Lazily imported names: attribute name -> (submodule, attribute)
+_LAZY_IMPORTS = {
+    "AuthService": (".service", "AuthService"),
+    "OrganizationsService": (".organizations", "OrganizationsService"),
+    "get_optional_user": (".dependencies", "get_optional_user"),
+    "require_auth": (".dependencies", "require_auth"),
+    "get_current_user": (".dependencies", "get_current_user"),
+    "get_token_from_header": (".dependencies", "get_token_from_header"),
+}
+
+
 def __getattr__(name):
-    """Lazy import for modules that require JWT dependencies."""
-    if name == "AuthService":
-        from .service import AuthService
-        return AuthService
-    elif name == "OrganizationsService":
-        from .organizations import OrganizationsService
-        return OrganizationsService
-    elif name == "get_optional_user":
-        from .dependencies import get_optional_user
-        return get_optional_user
-    elif name == "require_auth":
-        from .dependencies import require_auth
-        return require_auth
-    elif name == "get_current_user":
-        from .dependencies import get_current_user
-        return get_current_user
-    elif name == "get_token_from_header":
-        from .dependencies import get_token_from_header
-        return get_token_from_header
-    else:
+    """Lazy import for modules that require JWT dependencies.
+
+    The resolved object is stored in the module globals, so later lookups
+    are plain attribute loads and never reach this function again.
+    """
+    spec = _LAZY_IMPORTS.get(name)
+    if spec is None:
         raise AttributeError(f"module {__name__} has no attribute {name}")
 
+    module_name, attr = spec
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
 __all__.extend([
     "AuthService",
     "OrganizationsService",
@@ -0,0 +1,374 @@
+"""
+Auth Caches.
+
+Short-lived in-process caches for what the auth layer reads on every
+request: verified JWT payloads, the (User, Session, Organization,
+Membership) context resolved from an access token, organizations looked
+up by id, slug or access code, and memberships looked up by (user_id,
+organization_id).
+
+Row entries hold plain column snapshots rather than ORM instances, so a cached
+row can never carry unflushed changes from the request that loaded it. On
+a hit the snapshots are rebuilt and merged into the caller's session
+without emitting SQL.
+
+The caches are per process: with several workers an invalidation only
+reaches the worker that handled the write, so AUTH_CACHE_TTL_SECONDS
+bounds how long other workers may serve a stale entry.
+"""
+
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from ..config import settings
+
+# (user_id, jti, organization_id)
+CacheKey = Tuple[UUID, UUID, Optional[UUID]]
+
+Snapshot = Tuple[type, Dict[str, Any]]
+
+
+def _snapshot(obj: Any) -> Optional[Snapshot]:
+    """Capture the loaded column values of an ORM instance."""
+    if obj is None:
+        return None
+    state = inspect(obj)
+    values = {
+        attr.key: state.dict[attr.key]
+        for attr in state.mapper.column_attrs
+        if attr.key in state.dict
+    }
+    return type(obj), values
+
+
+async def _restore(
+    db: AsyncSession,
+    snapshot: Optional[Snapshot]
+) -> Any:
+    """Rebuild an instance from a snapshot and attach it to the session."""
+    if snapshot is None:
+        return None
+    cls, values = snapshot
+    obj = cls(**values)
+    make_transient_to_detached(obj)
+    return await db.merge(obj, load=False)
+
+
+class _TTLCache:
+    """Bounded TTL map shared by the auth caches."""
+
+    def __init__(self, ttl: int, max_entries: int, enabled: bool = True):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def _get(self, key: Hashable) -> Any:
+        """Return the live value for key, dropping it if expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def _put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key for ttl seconds (default: self.ttl)."""
+        if len(self._entries) >= self.max_entries:
+            self._evict()
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def _drop(self, matches: Callable[[Hashable, Any], bool]) -> int:
+        """Remove every entry for which matches(key, value) is true."""
+        stale = [
+            key for key, (_, value) in self._entries.items()
+            if matches(key, value)
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest ones if still full."""
+        now = time.monotonic()
+        for key in [k for k, (exp, _) in self._entries.items() if exp < now]:
+            del self._entries[key]
+
+        overflow = len(self._entries) - self.max_entries + 1
+        for key in list(self._entries)[:max(overflow, 0)]:
+            del self._entries[key]
+
+
+class AuthContextCache(_TTLCache):
+    """
+    TTL cache for resolved auth contexts.
+
+    Keys are (user_id, jti, organization_id); the database session is
+    never part of the key.
+    """
+
+    async def get(self, db: AsyncSession, key: CacheKey) -> Optional[tuple]:
+        """
+        Return the cached context attached to db, or None on a miss.
+
+        Args:
+            db: Session to merge the cached rows into
+            key: (user_id, jti, organization_id)
+
+        Returns:
+            Tuple of (User, Session, Organization, Membership) or None
+        """
+        if not self.enabled:
+            return None
+
+        snapshots = self._get(key)
+        if snapshots is None:
+            return None
+
+        return tuple([await _restore(db, snap) for snap in snapshots])
+
+    def set(self, key: CacheKey, context: tuple) -> None:
+        """
+        Store a freshly loaded context.
+
+        Args:
+            key: (user_id, jti, organization_id)
+            context: Tuple of (User, Session, Organization, Membership)
+        """
+        if not self.enabled:
+            return
+
+        self._put(key, tuple(_snapshot(obj) for obj in context))
+
+    def invalidate(
+        self,
+        user_id: Optional[UUID] = None,
+        organization_id: Optional[UUID] = None,
+        jti: Optional[UUID] = None
+    ) -> int:
+        """
+        Drop every entry matching all of the given fields.
+
+        Args:
+            user_id: Match entries for this user
+            organization_id: Match entries for this organization
+            jti: Match entries for this access token
+
+        Returns:
+            Number of entries removed
+        """
+        return self._drop(
+            lambda key, _: (user_id is None or key[0] == user_id)
+            and (jti is None or key[1] == jti)
+            and (organization_id is None or key[2] == organization_id)
+        )
+
+
+class OrganizationCache(_TTLCache):
+    """
+    TTL cache for active organizations.
+
+    Each organization is stored under ("id", id), ("slug", slug) and
+    ("access_code", code). Only hits are cached, so a newly created
+    organization is never hidden behind a cached miss.
+    """
+
+    LOOKUP_FIELDS = ("id", "slug", "access_code")
+
+    async def get(self, db: AsyncSession, field: str, value: Any) -> Any:
+        """
+        Return the cached organization attached to db, or None on a miss.
+
+        Args:
+            db: Session to merge the cached row into
+            field: One of LOOKUP_FIELDS
+            value: Lookup value
+
+        Returns:
+            Organization object or None
+        """
+        if not self.enabled:
+            return None
+
+        snapshot = self._get((field, value))
+        if snapshot is None:
+            return None
+        return await _restore(db, snapshot)
+
+    def set(self, organization: Any) -> None:
+        """
+        Store an organization under all of its lookup keys.
+
+        Args:
+            organization: Freshly loaded Organization
+        """
+        if not self.enabled or organization is None:
+            return
+
+        snapshot = _snapshot(organization)
+        for field in self.LOOKUP_FIELDS:
+            value = snapshot[1].get(field)
+            if value is not None:
+                self._put((field, value), snapshot)
+
+    def invalidate(self, organization_id: UUID) -> int:
+        """
+        Drop every lookup key of an organization.
+
+        Args:
+            organization_id: UUID of the organization
+
+        Returns:
+            Number of entries removed
+        """
+        return self._drop(
+            lambda _, snapshot: snapshot[1].get("id") == organization_id
+        )
+
+
+class MembershipCache(_TTLCache):
+    """
+    TTL cache for memberships keyed by (user_id, organization_id).
+
+    Only active rows are cached; a missing or deactivated membership is
+    always read from the database. Meant for read-only permission checks:
+    writes must load the row fresh, since other workers may hold a stale
+    entry for up to the TTL.
+    """
+
+    async def get(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        organization_id: UUID
+    ) -> Any:
+        """
+        Return the cached membership attached to db, or None on a miss.
+
+        Args:
+            db: Session to merge the cached row into
+            user_id: UUID of the user
+            organization_id: UUID of the organization
+
+        Returns:
+            Membership object or None
+        """
+        if not self.enabled:
+            return None
+
+        snapshot = self._get((user_id, organization_id))
+        if snapshot is None:
+            return None
+        return await _restore(db, snapshot)
+
+    def set(self, membership: Any) -> None:
+        """
+        Store a freshly loaded membership.
+
+        Args:
+            membership: Active Membership object
+        """
+        if not self.enabled or membership is None:
+            return
+
+        self._put(
+            (membership.user_id, membership.organization_id),
+            _snapshot(membership)
+        )
+
+    def invalidate(
+        self,
+        user_id: Optional[UUID] = None,
+        organization_id: Optional[UUID] = None
+    ) -> int:
+        """
+        Drop every entry matching all of the given fields.
+
+        Args:
+            user_id: Match entries for this user
+            organization_id: Match entries for this organization
+
+        Returns:
+            Number of entries removed
+        """
+        return self._drop(
+            lambda key, _: (user_id is None or key[0] == user_id)
+            and (organization_id is None or key[1] == organization_id)
+        )
+
+
+class TokenPayloadCache(_TTLCache):
+    """
+    TTL cache for verified JWT payloads keyed by the raw token string.
+
+    An entry never outlives the token's exp claim, so an expired token is
+    always decoded again and rejected. Revocation is not affected: it is
+    enforced by the session lookup, not by the payload.
+    """
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached payload for a token, or None on a miss.
+
+        Args:
+            token: Raw JWT string
+
+        Returns:
+            Decoded payload or None
+        """
+        if not self.enabled:
+            return None
+        return self._get(token)
+
+    def set(self, token: str, payload: Dict[str, Any]) -> None:
+        """
+        Store a payload that has just passed signature and claim checks.
+
+        Args:
+            token: Raw JWT string
+            payload: Decoded payload (must contain exp)
+        """
+        if not self.enabled:
+            return
+
+        remaining = payload["exp"] - time.time()
+        if remaining > 0:
+            self._put(token, payload, min(self.ttl, remaining))
+
+
+# Global cache instances
+auth_cache = AuthContextCache(
+    ttl=settings.AUTH_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+    enabled=settings.AUTH_CACHE_ENABLED
+)
+
+organization_cache = OrganizationCache(
+    ttl=settings.AUTH_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+    enabled=settings.AUTH_CACHE_ENABLED
+)
+
+membership_cache = MembershipCache(
+    ttl=settings.AUTH_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+    enabled=settings.AUTH_CACHE_ENABLED
+)
+
+token_cache = TokenPayloadCache(
+    ttl=settings.AUTH_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+    enabled=settings.AUTH_CACHE_ENABLED
+)
@@ -8,9 +8,11 @@ including head assignment and member assignment.
 from typing import Optional, List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, update, and_, func
+from sqlalchemy.orm import raiseload
 
 from .models import Department, Membership, User, Organization
+from .cache import auth_cache, membership_cache
 
 
 class DepartmentsService:
@@ -33,7 +35,6 @@ class DepartmentsService:
         )
         self.db.add(department)
         await self.db.commit()
-        await self.db.refresh(department)
         return department
 
     async def get_department(self, department_id: UUID) -> Optional[Department]:
@@ -41,15 +42,38 @@ class DepartmentsService:
         result = await self.db.execute(
             select(Department).where(
                 and_(Department.id == department_id, Department.is_active == True)
-            )
+            ).limit(1)
         )
-        return result.scalar_one_or_none()
+        return result.scalars().first()
 
     async def list_departments(self, organization_id: UUID) -> List[dict]:
         """List all active departments for an organization with head info."""
+        # Active member count per department, joined in as a subquery so the
+        # whole listing is a single round-trip
+        member_counts = (
+            select(
+                Membership.department_id,
+                func.count(Membership.id).label("member_count")
+            )
+            .where(
+                and_(
+                    Membership.organization_id == organization_id,
+                    Membership.is_active == True
+                )
+            )
+            .group_by(Membership.department_id)
+            .subquery()
+        )
+
         result = await self.db.execute(
-            select(Department, User).outerjoin(
+            select(
+                Department,
+                User.full_name,
+                func.coalesce(member_counts.c.member_count, 0)
+            ).outerjoin(
                 User, Department.head_user_id == User.id
+            ).outerjoin(
+                member_counts, member_counts.c.department_id == Department.id
             ).where(
                 and_(
                     Department.organization_id == organization_id,
@@ -57,33 +81,20 @@ class DepartmentsService:
                 )
             ).order_by(Department.name)
         )
-        rows = result.all()
-
-        departments = []
-        for dept, head_user in rows:
-            # Count members in this department
-            count_result = await self.db.execute(
-                select(func.count(Membership.id)).where(
-                    and_(
-                        Membership.department_id == dept.id,
-                        Membership.is_active == True
-                    )
-                )
-            )
-            member_count = count_result.scalar() or 0
 
-            departments.append({
+        return [
+            {
                 "id": str(dept.id),
                 "name": dept.name,
                 "organization_id": str(dept.organization_id),
                 "head_user_id": str(dept.head_user_id) if dept.head_user_id else None,
-                "head_user_name": head_user.full_name if head_user else None,
+                "head_user_name": head_user_name,
                 "member_count": member_count,
                 "is_active": dept.is_active,
                 "created_at": dept.created_at.isoformat() if dept.created_at else ""
-            })
-
-        return departments
+            }
+            for dept, head_user_name, member_count in result.all()
+        ]
 
     async def update_department(
         self,
@@ -102,25 +113,37 @@ class DepartmentsService:
             dept.head_user_id = head_user_id if str(head_user_id) != '' else None
 
         await self.db.commit()
-        await self.db.refresh(dept)
         return dept
 
     async def delete_department(self, department_id: UUID) -> bool:
         """Soft delete a department (unlinks members)."""
-        dept = await self.get_department(department_id)
-        if not dept:
-            return False
-
-        dept.is_active = False
-
-        # Unlink members from this department
+        # Deactivate the department and unlink its members in one statement;
+        # the final SELECT yields a row only if the department was active
+        deactivated = (
+            update(Department)
+            .where(and_(Department.id == department_id, Department.is_active == True))
+            .values(is_active=False)
+            .returning(Department.id, Department.organization_id)
+            .cte("deactivated")
+        )
+        unlinked = (
+            update(Membership)
+            .where(Membership.department_id.in_(select(deactivated.c.id)))
+            .values(department_id=None)
+            .returning(Membership.id)
+            .cte("unlinked")
+        )
         result = await self.db.execute(
-            select(Membership).where(Membership.department_id == department_id)
+            select(deactivated.c.organization_id).add_cte(unlinked)
         )
-        for membership in result.scalars().all():
-            membership.department_id = None
+        organization_id = result.scalar()
+        if organization_id is None:
+            return False
 
         await self.db.commit()
+        # Drop cached contexts of every unlinked member in one sweep
+        auth_cache.invalidate(organization_id=organization_id)
+        membership_cache.invalidate(organization_id=organization_id)
         return True
 
     async def assign_member(
@@ -131,21 +154,22 @@ class DepartmentsService:
     ) -> Optional[Membership]:
         """Assign a member to a department."""
         result = await self.db.execute(
-            select(Membership).where(
+            select(Membership).options(raiseload("*")).where(
                 and_(
                     Membership.user_id == user_id,
                     Membership.organization_id == organization_id,
                     Membership.is_active == True
                 )
-            )
+            ).limit(1)
         )
-        membership = result.scalar_one_or_none()
+        membership = result.scalars().first()
         if not membership:
             return None
 
         membership.department_id = department_id
         await self.db.commit()
-        await self.db.refresh(membership)
+        auth_cache.invalidate(user_id=user_id, organization_id=organization_id)
+        membership_cache.invalidate(user_id=user_id, organization_id=organization_id)
         return membership
 
     async def remove_member_from_department(
@@ -155,19 +179,20 @@ class DepartmentsService:
     ) -> Optional[Membership]:
         """Remove a member from their department (set department_id to None)."""
         result = await self.db.execute(
-            select(Membership).where(
+            select(Membership).options(raiseload("*")).where(
                 and_(
                     Membership.user_id == user_id,
                     Membership.organization_id == organization_id,
                     Membership.is_active == True
                 )
-            )
+            ).limit(1)
         )
-        membership = result.scalar_one_or_none()
+        membership = result.scalars().first()
         if not membership:
             return None
 
         membership.department_id = None
         await self.db.commit()
-        await self.db.refresh(membership)
+        auth_cache.invalidate(user_id=user_id, organization_id=organization_id)
+        membership_cache.invalidate(user_id=user_id, organization_id=organization_id)
         return membership
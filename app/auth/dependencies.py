@@ -25,15 +25,15 @@ Usage:
         pass
 """
 
+from functools import lru_cache
 from typing import Optional, Annotated
 from uuid import UUID
 from fastapi import Depends, HTTPException, status, Header
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database.connection import get_db
 from .service import AuthService
-from .models import User, Organization, Membership, UserRole
+from .models import User, Organization, Membership, UserRole, ROLE_RANK
 from ..config import settings
 
 
@@ -56,85 +56,142 @@ async def get_token_from_header(
     if not authorization:
         return None
 
-    if authorization.startswith("Bearer "):
-        return authorization[7:]  # Remove "Bearer " prefix
+    scheme, _, token = authorization.partition(" ")
+    return token if scheme == "Bearer" and token else None
 
-    return None
 
+# ============================================================
+# Auth Context
+# ============================================================
 
-async def get_token_from_cookie(
-    cookie: Optional[str] = None
-) -> Optional[str]:
+class OrganizationContext:
     """
-    Extract JWT token from cookie.
-
-    Args:
-        cookie: Cookie header value
+    Container for organization context in requests.
 
-    Returns:
-        Token string or None if not present
+    Holds the currently selected organization and user's membership role.
     """
-    # This would parse cookies for 'access_token'
-    # For now, we'll use header-based auth
-    return None
+
+    __slots__ = ("organization", "membership", "role")
+
+    def __init__(
+        self,
+        organization: Organization,
+        membership: Membership
+    ):
+        self.organization = organization
+        self.membership = membership
+        self.role = UserRole(membership.role)
+
+    def can_manage_members(self) -> bool:
+        """Check if user can manage organization members."""
+        return self.role.can_manage_members()
+
+    def can_manage_dialogs(self) -> bool:
+        """Check if user can manage dialogs."""
+        return self.role.can_manage_dialogs()
+
+    def can_view_dialogs(self) -> bool:
+        """Check if user can view dialogs."""
+        return self.role.can_view_dialogs()
+
+    def is_owner(self) -> bool:
+        """Check if user is organization owner."""
+        return self.role == UserRole.OWNER
+
+
+# (User, organization_id from token, OrganizationContext if an org is selected)
+AuthResult = tuple[User, Optional[UUID], Optional[OrganizationContext]]
 
 
 # ============================================================
 # User Dependencies
 # ============================================================
 
+@lru_cache(maxsize=8192)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID claim, memoized across requests carrying the same token."""
+    return UUID(value)
+
+
 async def _get_user_from_token(
     token: Optional[str],
     db: AsyncSession
-) -> Optional[tuple[User, Optional[UUID]]]:
+) -> Optional[AuthResult]:
     """
     Helper to extract user and organization from token.
 
+    The user, the active session and (when the token carries an
+    organization) the membership are loaded in a single query.
+
     Args:
         token: JWT token string or None
         db: Database session
 
     Returns:
-        Tuple of (User, organization_id) or None
+        Tuple of (User, organization_id, OrganizationContext) or None
     """
     if not token:
         return None
 
     try:
         auth_service = AuthService(db)
-        payload = auth_service.decode_token(token)
+        payload = auth_service.decode_token(token, "access")
 
-        # Verify it's an access token
-        if not auth_service.verify_token_type(payload, "access"):
-            return None
-
-        # Get user
-        user_id = UUID(payload.get("sub"))
-        user = await auth_service.get_user_by_id(user_id)
-
-        if not user or not user.is_active:
-            return None
+        user_id = _parse_uuid(payload["sub"])
 
         # Get organization from token if present
         organization_id = None
         if "org_id" in payload:
-            organization_id = UUID(payload["org_id"])
+            organization_id = _parse_uuid(payload["org_id"])
+
+        row = await auth_service.resolve_full_context(
+            user_id, _parse_uuid(payload["jti"]), organization_id
+        )
+        if not row:
+            return None
+
+        user, session, organization, membership = row
 
-        # Verify session is still active
-        jti = payload.get("jti")
-        session = await auth_service.get_session_by_jti(jti)
-        if not session or not session.is_valid():
+        # Verify user is active and session is still valid
+        if not user.is_active or not session.is_valid:
             return None
 
-        return user, organization_id
+        org_ctx = None
+        if organization is not None and membership is not None:
+            org_ctx = OrganizationContext(organization, membership)
 
-    except (ValueError, KeyError):
+        return user, organization_id, org_ctx
+
+    except (ValueError, KeyError, TypeError):
         return None
 
 
-async def get_optional_user(
+async def _resolve_auth(
     token: Optional[str] = Depends(get_token_from_header),
     db: AsyncSession = Depends(get_db)
+) -> Optional[AuthResult]:
+    """
+    Resolve the request's token to a user and selected organization.
+
+    All auth dependencies depend on this function, so FastAPI's
+    per-request dependency cache runs the JWT decode and the user/session
+    lookups once per request no matter how many of them a route uses.
+
+    Args:
+        token: JWT token from header
+        db: Database session
+
+    Returns:
+        Tuple of (User, organization_id, OrganizationContext) or None
+    """
+    if not settings.auth_enabled:
+        return None
+
+    return await _get_user_from_token(token, db)
+
+
+async def get_optional_user(
+    auth: Optional[AuthResult] = Depends(_resolve_auth)
 ) -> Optional[User]:
     """
     Get user if authenticated, None otherwise.
@@ -143,8 +200,7 @@ async def get_optional_user(
     Use this for routes that work both with and without auth.
 
     Args:
-        token: JWT token from header
-        db: Database session
+        auth: Resolved auth result or None
 
     Returns:
         User object or None if not authenticated
@@ -156,19 +212,13 @@ async def get_optional_user(
                 return {"data": "personalized", "user": user.email}
             return {"data": "public"}
     """
-    if not settings.auth_enabled:
-        # Auth disabled - no user
-        return None
-
-    result = await _get_user_from_token(token, db)
-    if result:
-        return result[0]
+    if auth:
+        return auth[0]
     return None
 
 
 async def require_auth(
-    token: Optional[str] = Depends(get_token_from_header),
-    db: AsyncSession = Depends(get_db)
+    auth: Optional[AuthResult] = Depends(_resolve_auth)
 ) -> User:
     """
     Require user to be authenticated.
@@ -176,8 +226,7 @@ async def require_auth(
     Raises HTTPException if user is not authenticated.
 
     Args:
-        token: JWT token from header
-        db: Database session
+        auth: Resolved auth result or None
 
     Returns:
         Authenticated User object
@@ -198,21 +247,18 @@ async def require_auth(
             detail="Authentication is disabled. Set FEATURE_FLAG_AUTH=true to enable."
         )
 
-    result = await _get_user_from_token(token, db)
-    if not result:
+    if not auth:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user, _ = result
-    return user
+    return auth[0]
 
 
 async def get_current_user(
-    token: Optional[str] = Depends(get_token_from_header),
-    db: AsyncSession = Depends(get_db)
+    auth: Optional[AuthResult] = Depends(_resolve_auth)
 ) -> Optional[User]:
     """
     Get current authenticated user with full session context.
@@ -221,18 +267,13 @@ async def get_current_user(
     when auth is enabled but no token provided.
 
     Args:
-        token: JWT token from header
-        db: Database session
+        auth: Resolved auth result or None
 
     Returns:
         User object or None
     """
-    if not settings.auth_enabled:
-        return None
-
-    result = await _get_user_from_token(token, db)
-    if result:
-        return result[0]
+    if auth:
+        return auth[0]
     return None
 
 
@@ -240,42 +281,8 @@ async def get_current_user(
 # Organization Dependencies
 # ============================================================
 
-class OrganizationContext:
-    """
-    Container for organization context in requests.
-
-    Holds the currently selected organization and user's membership role.
-    """
-
-    def __init__(
-        self,
-        organization: Organization,
-        membership: Membership
-    ):
-        self.organization = organization
-        self.membership = membership
-        self.role = UserRole(membership.role)
-
-    def can_manage_members(self) -> bool:
-        """Check if user can manage organization members."""
-        return self.role.can_manage_members()
-
-    def can_manage_dialogs(self) -> bool:
-        """Check if user can manage dialogs."""
-        return self.role.can_manage_dialogs()
-
-    def can_view_dialogs(self) -> bool:
-        """Check if user can view dialogs."""
-        return self.role.can_view_dialogs()
-
-    def is_owner(self) -> bool:
-        """Check if user is organization owner."""
-        return self.role == UserRole.OWNER
-
-
 async def get_current_organization(
-    token: Optional[str] = Depends(get_token_from_header),
-    db: AsyncSession = Depends(get_db)
+    auth: Optional[AuthResult] = Depends(_resolve_auth)
 ) -> Optional[OrganizationContext]:
     """
     Get currently selected organization from token.
@@ -284,8 +291,7 @@ async def get_current_organization(
     is selected in the current session.
 
     Args:
-        token: JWT token from header
-        db: Database session
+        auth: Resolved auth result or None
 
     Returns:
         OrganizationContext object or None if no org selected
@@ -299,38 +305,11 @@ async def get_current_organization(
                 return {"org": org_ctx.organization.name}
             return {"message": "No organization selected"}
     """
-    if not settings.auth_enabled:
-        return None
-
-    result = await _get_user_from_token(token, db)
-    if not result:
-        return None
-
-    user, organization_id = result
-
-    if not organization_id:
-        return None
-
-    # Get organization and membership
-    auth_service = AuthService(db)
-
-    result = await db.execute(
-        select(Organization, Membership).join(
-            Membership,
-            Membership.organization_id == Organization.id
-        ).where(
-            Membership.user_id == user.id,
-            Membership.organization_id == organization_id,
-            Membership.is_active == True
-        )
-    )
-
-    row = result.first()
-    if not row:
+    if not auth:
         return None
 
-    organization, membership = row
-    return OrganizationContext(organization, membership)
+    # Organization and membership were loaded with the user and session
+    return auth[2]
 
 
 async def require_organization(
@@ -363,10 +342,15 @@ async def require_organization(
 # Role-based Dependencies
 # ============================================================
 
+@lru_cache(maxsize=None)
 def require_role(required_role: UserRole):
     """
     Create dependency that requires specific role in organization.
 
+    The dependency is memoized per role, so every Depends(require_role(...))
+    for the same role shares one callable and FastAPI resolves it once per
+    request.
+
     Args:
         required_role: Minimum required role
 
@@ -381,6 +365,8 @@ def require_role(required_role: UserRole):
             # Only admins and owners can access
             pass
     """
+    required_rank = ROLE_RANK.get(required_role, 0)
+
     async def check_role(
         org_ctx: Optional[OrganizationContext] = Depends(get_current_organization)
     ) -> OrganizationContext:
@@ -390,15 +376,7 @@ def require_role(required_role: UserRole):
                 detail="Organization selection required"
             )
 
-        # Role hierarchy: OWNER > ADMIN > MEMBER > VIEWER
-        role_hierarchy = {
-            UserRole.OWNER: 4,
-            UserRole.ADMIN: 3,
-            UserRole.MEMBER: 2,
-            UserRole.VIEWER: 1
-        }
-
-        if role_hierarchy.get(org_ctx.role, 0) < role_hierarchy.get(required_role, 0):
+        if ROLE_RANK.get(org_ctx.role, 0) < required_rank:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Role '{required_role.value}' or higher required"
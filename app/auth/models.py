@@ -14,21 +14,112 @@ Key Design Decisions:
 - Memberships support RBAC with role-based permissions
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, List
 from uuid import uuid4
 
+import bcrypt
 from sqlalchemy import (
-    Column, String, DateTime, Boolean, Integer, ForeignKey, Text, Index,
-    UniqueConstraint, CheckConstraint
+    Column, String, DateTime, Boolean, Integer, ForeignKey, Text, Index, LargeBinary,
+    UniqueConstraint, and_, select
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import ENUM, UUID, JSONB
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import (
+    column_property, deferred, raiseload, relationship, selectinload
+)
+from sqlalchemy.sql import func, text
 
 from ..database.models import Base
+from ..config import settings
+
+# bcrypt releases the GIL while hashing, so a thread pool lets password
+# checks run in parallel off the event loop
+_BCRYPT_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt"
+)
+
+
+def _hash_password(password: str) -> bytes:
+    """Hash a password with the configured bcrypt cost."""
+    salt = bcrypt.gensalt(settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode('utf-8'), salt)
+
+
+@lru_cache(maxsize=1)
+def _dummy_hash() -> bytes:
+    """Hash of a throwaway password, computed once on first use."""
+    return _hash_password(uuid4().hex)
+
+
+def _check_password(password: str, password_hash: Optional[bytes]) -> bool:
+    """
+    Check a password against a bcrypt hash.
+
+    A missing hash is still compared against a dummy hash, so the call
+    takes as long as a real check and does not reveal the missing hash.
+    """
+    if not password_hash:
+        verify_dummy(password)
+        return False
+    try:
+        return bcrypt.checkpw(password.encode('utf-8'), password_hash)
+    except Exception:
+        return False
+
+
+def _needs_rehash(password_hash: Optional[bytes]) -> bool:
+    """Whether a bcrypt hash ($2b$<cost>$...) uses a cost other than BCRYPT_ROUNDS."""
+    try:
+        return int(password_hash[4:6]) != settings.BCRYPT_ROUNDS
+    except (TypeError, ValueError):
+        return False
+
+
+def verify_dummy(password: str) -> None:
+    """
+    Run a bcrypt check whose result is discarded.
+
+    Call this on the "user not found" branch of a login so it costs the
+    same as a wrong password and does not reveal whether the account exists.
+
+    Args:
+        password: Plain text password from the request
+    """
+    try:
+        bcrypt.checkpw(password.encode('utf-8'), _dummy_hash())
+    except Exception:
+        pass
+
+
+async def verify_dummy_async(password: str) -> None:
+    """
+    Run verify_dummy in the bcrypt thread pool.
+
+    Args:
+        password: Plain text password from the request
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_BCRYPT_POOL, verify_dummy, password)
+
+
+async def warm_dummy_hash() -> None:
+    """
+    Compute the dummy hash in the bcrypt thread pool ahead of the first login.
+
+    Without this the first unknown-user login in each worker pays for an
+    extra bcrypt hash on top of the dummy check.
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_BCRYPT_POOL, _dummy_hash)
 
 
 class UserRole(str, Enum):
@@ -49,21 +140,49 @@ class UserRole(str, Enum):
     VIEWER = "viewer"
 
     @classmethod
-    def all(cls) -> List[str]:
-        """Return list of all valid role names."""
-        return [r.value for r in cls]
+    def all(cls) -> tuple[str, ...]:
+        """Return all valid role names."""
+        return _ALL_ROLES
 
     def can_manage_members(self) -> bool:
         """Check if role can manage organization members."""
-        return self in (UserRole.OWNER, UserRole.ADMIN)
+        return self in _MANAGE_MEMBERS
 
     def can_manage_dialogs(self) -> bool:
         """Check if role can create/edit/delete dialogs."""
-        return self in (UserRole.OWNER, UserRole.ADMIN, UserRole.MEMBER)
+        return self in _MANAGE_DIALOGS
 
     def can_view_dialogs(self) -> bool:
         """Check if role can view dialogs and analytics."""
-        return self in (UserRole.OWNER, UserRole.ADMIN, UserRole.MEMBER, UserRole.VIEWER)
+        return self in _VIEW_DIALOGS
+
+
+# Role sets for permission checks (Enum bodies cannot hold non-member constants)
+_ALL_ROLES = tuple(r.value for r in UserRole)
+_MANAGE_MEMBERS = frozenset({UserRole.OWNER, UserRole.ADMIN})
+_MANAGE_DIALOGS = _MANAGE_MEMBERS | {UserRole.MEMBER}
+_VIEW_DIALOGS = _MANAGE_DIALOGS | {UserRole.VIEWER}
+
+# Role hierarchy: OWNER > ADMIN > MEMBER > VIEWER. UserRole is a str Enum,
+# so lookups work with both UserRole members and raw role strings.
+ROLE_RANK = {
+    UserRole.OWNER: 4,
+    UserRole.ADMIN: 3,
+    UserRole.MEMBER: 2,
+    UserRole.VIEWER: 1
+}
+
+# Native PostgreSQL enum for Membership.role; the enum enforces valid roles
+UserRoleType = ENUM(*_ALL_ROLES, name='user_role')
+
+# Slug normalisation: drop punctuation, then collapse whitespace/dashes
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASHES = re.compile(r'[-\s]+')
+
+
+def slugify(name: str) -> str:
+    """Turn an organization name into a lowercase, dash-separated slug base."""
+    return _SLUG_DASHES.sub('-', _SLUG_STRIP.sub('', name).strip().lower())
 
 
 class User(Base):
@@ -93,15 +212,18 @@ class User(Base):
     __tablename__ = "users"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
 
     # Authentication fields
     username = Column(String(100), nullable=True, unique=True, index=True,
                      comment="Unique username for login (organization-specific)")
     email = Column(String(255), nullable=True, unique=True, index=True,
                    comment="User email address (optional, unique if provided)")
-    password_hash = Column(String(255), nullable=False,
-                          comment="Bcrypt hash of user password")
+    # Deferred: only password checks need the hash. Load it explicitly with
+    # undefer(User.password_hash) or await user.awaitable_attrs.password_hash.
+    password_hash = deferred(Column(LargeBinary(60), nullable=False,
+                                    comment="Bcrypt hash of user password"),
+                             group="secrets")
 
     # Profile fields
     full_name = Column(String(255), nullable=False,
@@ -132,9 +254,7 @@ class User(Base):
         Args:
             password: Plain text password to hash
         """
-        import bcrypt
-        salt = bcrypt.gensalt()
-        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        self.password_hash = _hash_password(password)
 
     def verify_password(self, password: str) -> bool:
         """
@@ -146,14 +266,76 @@ class User(Base):
         Returns:
             True if password matches, False otherwise
         """
-        import bcrypt
-        try:
-            return bcrypt.checkpw(
-                password.encode('utf-8'),
-                self.password_hash.encode('utf-8')
-            )
-        except Exception:
-            return False
+        return _check_password(password, self.password_hash)
+
+    def password_needs_rehash(self) -> bool:
+        """
+        Check whether the stored hash was made with a different BCRYPT_ROUNDS.
+
+        Returns:
+            True if the password should be rehashed at the current cost
+        """
+        return _needs_rehash(self.password_hash)
+
+    async def set_password_async(self, password: str) -> None:
+        """
+        Hash and set the user's password in the bcrypt thread pool.
+
+        Args:
+            password: Plain text password to hash
+        """
+        loop = asyncio.get_running_loop()
+        self.password_hash = await loop.run_in_executor(
+            _BCRYPT_POOL, _hash_password, password
+        )
+
+    @classmethod
+    async def bulk_set_passwords_async(
+        cls,
+        pairs: List[tuple['User', str]]
+    ) -> None:
+        """
+        Hash passwords for many users concurrently in the bcrypt thread pool.
+
+        Intended for bulk user creation, where hashing one password at a
+        time would take rounds x users of serial CPU time.
+
+        Args:
+            pairs: (user, plain text password) tuples
+        """
+        loop = asyncio.get_running_loop()
+        hashes = await asyncio.gather(*[
+            loop.run_in_executor(_BCRYPT_POOL, _hash_password, password)
+            for _, password in pairs
+        ])
+        for (user, _), password_hash in zip(pairs, hashes):
+            user.password_hash = password_hash
+
+    async def verify_password_async(self, password: str) -> bool:
+        """
+        Verify a password in the bcrypt thread pool.
+
+        Args:
+            password: Plain text password to verify
+
+        Returns:
+            True if password matches, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _BCRYPT_POOL, _check_password, password, self.password_hash
+        )
+
+    @classmethod
+    def organizations_loader(cls):
+        """
+        Loader option for get_organizations / has_role_in_organization.
+
+        Loads memberships and their organizations in two IN queries, so the
+        helpers below do not lazy-load per membership. Usage:
+            select(User).options(User.organizations_loader())
+        """
+        return selectinload(cls.memberships).selectinload(Membership.organization)
 
     def get_organizations(self, active_only: bool = True) -> List['Organization']:
         """
@@ -165,10 +347,9 @@ class User(Base):
         Returns:
             List of Organization objects
         """
-        query = [m.organization for m in self.memberships]
         if active_only:
-            query = [m.organization for m in self.memberships if m.is_active]
-        return query
+            return [m.organization for m in self.memberships if m.is_active]
+        return [m.organization for m in self.memberships]
 
     def has_role_in_organization(self, organization_id, role: UserRole) -> bool:
         """
@@ -181,10 +362,12 @@ class User(Base):
         Returns:
             True if user has the role, False otherwise
         """
-        for membership in self.memberships:
-            if membership.organization_id == organization_id:
-                return membership.role == role
-        return False
+        # Scanned per call: a user has only a handful of memberships, and a
+        # cached map would go stale when the collection changes
+        return any(
+            m.organization_id == organization_id and m.role == role
+            for m in self.memberships
+        )
 
 
 class Organization(Base):
@@ -211,7 +394,7 @@ class Organization(Base):
     __tablename__ = "organizations"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
 
     # Organization details
     name = Column(String(255), nullable=False,
@@ -232,11 +415,26 @@ class Organization(Base):
                        comment="Last update timestamp")
 
     # Relationships
+    # Collections stay lazy: the auth hot path reads a single organization
+    # and membership through an explicit JOIN, and a selectin default would
+    # load every member on each of those reads. Queries that need the
+    # collection request it with .options(selectinload(...)).
     memberships = relationship("Membership", back_populates="organization",
                               cascade="all, delete-orphan")
     departments = relationship("Department", back_populates="organization",
                               cascade="all, delete-orphan")
 
+    @classmethod
+    def members_loader(cls):
+        """
+        Loader option for get_owner / get_active_members.
+
+        Loads memberships and their users in two IN queries, so the helpers
+        below do not lazy-load per member. Usage:
+            select(Organization).options(Organization.members_loader())
+        """
+        return selectinload(cls.memberships).selectinload(Membership.user)
+
     def get_owner(self) -> Optional[User]:
         """Get the owner user of this organization."""
         for membership in self.memberships:
@@ -248,17 +446,13 @@ class Organization(Base):
         """Get all active members of the organization."""
         return [m.user for m in self.memberships if m.is_active]
 
-    def member_count(self) -> int:
-        """Get count of active members."""
-        return sum(1 for m in self.memberships if m.is_active)
-
 
 class Department(Base):
     """Department within an organization, optionally led by a user."""
 
     __tablename__ = "departments"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"),
                             nullable=False, index=True)
     name = Column(String(255), nullable=False)
@@ -273,20 +467,26 @@ class Department(Base):
     members = relationship("Membership", back_populates="department",
                           foreign_keys="Membership.department_id")
 
+    __table_args__ = (
+        # Active departments of an organization in name order (department list)
+        Index('ix_departments_organization_id_name_active', 'organization_id', 'name',
+              postgresql_where=text('is_active')),
+    )
+
 
 class Membership(Base):
     """Membership model for user-organization relationship with optional department."""
 
     __tablename__ = "memberships"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"),
-                    nullable=False, index=True)
+                    nullable=False)
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"),
-                            nullable=False, index=True)
+                            nullable=False)
     department_id = Column(UUID(as_uuid=True), ForeignKey("departments.id", ondelete="SET NULL"),
-                          nullable=True, index=True)
-    role = Column(String(50), nullable=False, default=UserRole.MEMBER.value)
+                          nullable=True)
+    role = Column(UserRoleType, nullable=False, default=UserRole.MEMBER.value)
     is_active = Column(Boolean, nullable=False, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -296,13 +496,21 @@ class Membership(Base):
     department = relationship("Department", back_populates="members",
                             foreign_keys=[department_id])
 
-    roles_list = "', '".join(UserRole.all())
     __table_args__ = (
         UniqueConstraint('user_id', 'organization_id', name='uq_user_organization'),
-        CheckConstraint(
-            f"role IN ('{roles_list}')",
-            name='ck_valid_role'
-        )
+        # Covering indexes for membership checks (index-only scans),
+        # restricted to active memberships. The partial predicate replaces a
+        # leading is_active key column, and uq_user_organization serves
+        # lookups that ignore is_active, so no (org, is_active, user) or
+        # (user, is_active) composites are needed.
+        Index('ix_memberships_user_id', 'user_id',
+              postgresql_include=['organization_id', 'role', 'is_active'],
+              postgresql_where=text('is_active')),
+        Index('ix_memberships_organization_id', 'organization_id',
+              postgresql_include=['user_id', 'role', 'is_active'],
+              postgresql_where=text('is_active')),
+        Index('ix_memberships_department_id', 'department_id',
+              postgresql_where=text('department_id IS NOT NULL')),
     )
 
 
@@ -330,16 +538,16 @@ class Session(Base):
     __tablename__ = "sessions"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
 
     # Foreign key
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"),
-                    nullable=False, index=True, comment="Reference to user")
+                    nullable=False, comment="Reference to user")
 
     # Token tracking
-    token_jti = Column(String(255), nullable=False, unique=True, index=True,
+    token_jti = Column(UUID(as_uuid=True), nullable=False, unique=True,
                       comment="JWT Token ID for revocation")
-    refresh_token_jti = Column(String(255), nullable=True, unique=True, index=True,
+    refresh_token_jti = Column(UUID(as_uuid=True), nullable=True, unique=True,
                               comment="Refresh Token ID for revocation")
 
     # Context
@@ -347,7 +555,7 @@ class Session(Base):
                              comment="Currently selected organization ID")
 
     # Expiration
-    expires_at = Column(DateTime(timezone=True), nullable=False,
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True,
                        comment="Session expiration time")
 
     # Status
@@ -361,14 +569,81 @@ class Session(Base):
     # Relationships
     user = relationship("User", back_populates="sessions")
 
+    __table_args__ = (
+        # Covering index for per-request session validation (index-only scan)
+        Index('ix_sessions_token_jti', 'token_jti',
+              postgresql_include=['user_id', 'organization_id', 'expires_at', 'is_active'],
+              postgresql_where=text('is_active')),
+        Index('ix_sessions_user_id', 'user_id',
+              postgresql_where=text('is_active')),
+        # Refresh-token lookups only ever target active sessions
+        Index('ix_sessions_refresh_token_jti', 'refresh_token_jti',
+              postgresql_where=text('is_active AND refresh_token_jti IS NOT NULL')),
+    )
+
+    @hybrid_property
     def is_valid(self) -> bool:
-        """Check if session is currently valid (active and not expired)."""
-        return self.is_active and (
-            self.expires_at.replace(tzinfo=None) > datetime.utcnow()
-            if self.expires_at.tzinfo is not None
-            else self.expires_at > datetime.utcnow()
-        )
+        """
+        Check if session is currently valid (active and not expired).
+
+        expires_at is TIMESTAMPTZ and always written timezone-aware, so it
+        compares directly against an aware UTC now.
+        """
+        return self.is_active and self.expires_at > datetime.now(timezone.utc)
+
+    @is_valid.expression
+    def is_valid(cls):
+        """SQL form: filter(Session.is_valid) renders is_active AND expires_at > now()."""
+        return and_(cls.is_active == True, cls.expires_at > func.now())
 
     def revoke(self) -> None:
         """Revoke (deactivate) the session."""
         self.is_active = False
+
+
+# Active member count computed by the database. Deferred, so it is only
+# selected when requested with .options(undefer(Organization.member_count)).
+Organization.member_count = column_property(
+    select(func.count(Membership.id))
+    .where(
+        Membership.organization_id == Organization.id,
+        Membership.is_active == True
+    )
+    .correlate_except(Membership)
+    .scalar_subquery(),
+    deferred=True
+)
+
+
+def user_loader_options() -> tuple:
+    """
+    Loader options for a User whose membership helpers will be used.
+
+    Eager-loads memberships with their organizations and departments and
+    makes every other relationship raise on access, so a missing
+    selectinload fails loudly instead of issuing a hidden lazy query.
+
+    Usage:
+        select(User).options(*user_loader_options()).where(User.id == user_id)
+    """
+    return (
+        User.organizations_loader(),
+        selectinload(User.memberships).selectinload(Membership.department),
+        raiseload("*"),
+    )
+
+
+def organization_loader_options() -> tuple:
+    """
+    Loader options for an Organization whose member helpers will be used.
+
+    Eager-loads memberships with their users; every other relationship
+    raises on access.
+
+    Usage:
+        select(Organization).options(*organization_loader_options())
+    """
+    return (
+        Organization.members_loader(),
+        raiseload("*"),
+    )
@@ -12,16 +12,30 @@ Key design: Users are created directly by org owners with email/password.
 No invitation mechanism - accounts are ready immediately.
 """
 
+import os
 from typing import Optional, List
 from uuid import UUID, uuid4
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, update, exists, func, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload
 
-from .models import User, Organization, Membership, Session, UserRole
+from .models import User, Organization, Membership, Session, UserRole, ROLE_RANK, slugify
 from .service import AuthService
+from .cache import auth_cache, membership_cache, organization_cache
 from ..database.models import Dialog
 
+# Access code alphabet (no 0/O or 1/I) and insert attempts on collision.
+# Exactly 32 symbols, so masking a random byte with & 31 is unbiased.
+ACCESS_CODE_ALPHABET = b'ABCDEFGHJKLMNPQRSTUVWXYZ23456789'
+ACCESS_CODE_ATTEMPTS = 5
+
+
+def _constraint_name(error: IntegrityError) -> Optional[str]:
+    """Name of the constraint or unique index an asyncpg IntegrityError violated."""
+    return getattr(getattr(error.orig, "__cause__", None), "constraint_name", None)
+
 
 class OrganizationAlreadyExistsError(Exception):
     """Raised when trying to create an organization with duplicate slug."""
@@ -85,45 +99,58 @@ class OrganizationsService:
         Raises:
             OrganizationAlreadyExistsError: If slug already exists
         """
-        # Check user exists
-        owner = await self.auth_service.get_user_by_id(owner_user_id)
-        if not owner:
-            raise ValueError("Owner user not found")
-
         # Generate slug if not provided
         if not slug:
             slug = self._generate_slug(name)
 
-        # Check slug uniqueness
-        existing = await self.get_organization_by_slug(slug)
-        if existing:
-            raise OrganizationAlreadyExistsError(
-                f"Organization with slug '{slug}' already exists"
+        # Check owner exists and slug is free in one round trip
+        result = await self.db.execute(
+            select(
+                exists().where(User.id == owner_user_id),
+                exists().where(
+                    Organization.slug == slug,
+                    Organization.is_active == True
+                )
             )
-
-        # Generate unique access code
-        access_code = await self._generate_access_code()
-
-        # Create organization
-        organization = Organization(
-            name=name,
-            slug=slug,
-            access_code=access_code
         )
+        owner_exists, slug_taken = result.one()
 
-        self.db.add(organization)
-        await self.db.flush()  # Get ID without committing
+        if not owner_exists:
+            raise ValueError("Owner user not found")
 
-        # Create owner membership
-        membership = Membership(
-            user_id=owner_user_id,
-            organization_id=organization.id,
-            role=UserRole.OWNER.value
-        )
+        if slug_taken:
+            raise OrganizationAlreadyExistsError(
+                f"Organization with slug '{slug}' already exists"
+            )
 
-        self.db.add(membership)
-        await self.db.commit()
-        await self.db.refresh(organization)
+        # Create organization and owner membership in one flush. The unique
+        # index on access_code catches the (rare) code collision, so no
+        # probe SELECT is needed per attempt.
+        for attempt in range(1, ACCESS_CODE_ATTEMPTS + 1):
+            organization = Organization(
+                id=uuid4(),
+                name=name,
+                slug=slug,
+                access_code=self._generate_access_code()
+            )
+            membership = Membership(
+                user_id=owner_user_id,
+                organization_id=organization.id,
+                role=UserRole.OWNER.value
+            )
+            self.db.add_all([organization, membership])
+            try:
+                await self.db.commit()
+                break
+            except IntegrityError as e:
+                await self.db.rollback()
+                constraint = _constraint_name(e)
+                if constraint == "ix_organizations_slug":
+                    raise OrganizationAlreadyExistsError(
+                        f"Organization with slug '{slug}' already exists"
+                    )
+                if constraint != "ix_organizations_access_code" or attempt == ACCESS_CODE_ATTEMPTS:
+                    raise
 
         return organization
 
@@ -140,15 +167,19 @@ class OrganizationsService:
         Returns:
             Organization object or None
         """
+        cached = await organization_cache.get(self.db, "id", organization_id)
+        if cached is not None:
+            return cached
+
         result = await self.db.execute(
             select(Organization).where(
-                and_(
-                    Organization.id == organization_id,
-                    Organization.is_active == True
-                )
+                Organization.id == organization_id,
+                Organization.is_active == True
             )
         )
-        return result.scalar_one_or_none()
+        organization = result.scalar_one_or_none()
+        organization_cache.set(organization)
+        return organization
 
     async def get_organization_by_slug(self, slug: str) -> Optional[Organization]:
         """
@@ -160,15 +191,19 @@ class OrganizationsService:
         Returns:
             Organization object or None
         """
+        cached = await organization_cache.get(self.db, "slug", slug)
+        if cached is not None:
+            return cached
+
         result = await self.db.execute(
             select(Organization).where(
-                and_(
-                    Organization.slug == slug,
-                    Organization.is_active == True
-                )
+                Organization.slug == slug,
+                Organization.is_active == True
             )
         )
-        return result.scalar_one_or_none()
+        organization = result.scalar_one_or_none()
+        organization_cache.set(organization)
+        return organization
 
     async def get_organization_by_access_code(self, access_code: str) -> Optional[Organization]:
         """
@@ -180,15 +215,40 @@ class OrganizationsService:
         Returns:
             Organization object or None
         """
+        access_code = access_code.upper()
+        cached = await organization_cache.get(self.db, "access_code", access_code)
+        if cached is not None:
+            return cached
+
         result = await self.db.execute(
             select(Organization).where(
-                and_(
-                    Organization.access_code == access_code.upper(),
+                Organization.access_code == access_code,
+                Organization.is_active == True
+            )
+        )
+        organization = result.scalar_one_or_none()
+        organization_cache.set(organization)
+        return organization
+
+    async def _organization_exists(self, organization_id: UUID) -> bool:
+        """
+        Check whether an active organization exists without loading it.
+
+        Args:
+            organization_id: UUID of the organization
+
+        Returns:
+            True if the organization exists and is active
+        """
+        result = await self.db.execute(
+            select(
+                exists().where(
+                    Organization.id == organization_id,
                     Organization.is_active == True
                 )
             )
         )
-        return result.scalar_one_or_none()
+        return result.scalar()
 
     async def update_organization(
         self,
@@ -205,15 +265,27 @@ class OrganizationsService:
         Returns:
             Updated Organization or None if not found
         """
-        organization = await self.get_organization_by_id(organization_id)
-        if not organization:
-            return None
+        if not name:
+            return await self.get_organization_by_id(organization_id)
 
-        if name:
-            organization.name = name
+        # Existence check and write in one statement
+        result = await self.db.execute(
+            update(Organization)
+            .where(
+                Organization.id == organization_id,
+                Organization.is_active == True
+            )
+            .values(name=name)
+            .returning(Organization)
+            .execution_options(populate_existing=True)
+        )
+        organization = result.scalar_one_or_none()
+        if organization is None:
+            return None
 
         await self.db.commit()
-        await self.db.refresh(organization)
+        auth_cache.invalidate(organization_id=organization_id)
+        organization_cache.invalidate(organization_id)
 
         return organization
 
@@ -227,12 +299,22 @@ class OrganizationsService:
         Returns:
             True if deleted, False if not found
         """
-        organization = await self.get_organization_by_id(organization_id)
-        if not organization:
+        result = await self.db.execute(
+            update(Organization)
+            .where(
+                Organization.id == organization_id,
+                Organization.is_active == True
+            )
+            .values(is_active=False)
+            .returning(Organization.id)
+        )
+        if result.scalar_one_or_none() is None:
             return False
 
-        organization.is_active = False
         await self.db.commit()
+        auth_cache.invalidate(organization_id=organization_id)
+        membership_cache.invalidate(organization_id=organization_id)
+        organization_cache.invalidate(organization_id)
 
         return True
 
@@ -273,12 +355,11 @@ class OrganizationsService:
             ValueError: If role is invalid
         """
         # Validate role
-        if role not in UserRole.all():
+        if role not in ROLE_RANK:
             raise ValueError(f"Invalid role: {role}")
 
         # Check organization exists
-        organization = await self.get_organization_by_id(organization_id)
-        if not organization:
+        if not await self._organization_exists(organization_id):
             raise ValueError("Organization not found")
 
         # Create user using auth service
@@ -333,19 +414,33 @@ class OrganizationsService:
                 f"User with email '{user_email}' not found"
             )
 
-        # Check if already member
-        existing = await self.get_membership(organization_id, user.id)
-        if existing:
-            if existing.is_active:
-                raise ValueError("User is already a member of this organization")
-            # Reactivate
-            existing.is_active = True
-            existing.role = role
-            await self.db.commit()
-            return existing
+        # Create the membership, or reactivate an inactive one, in one
+        # statement. An active membership is left alone and returns no row.
+        stmt = pg_insert(Membership).values(
+            user_id=user.id,
+            organization_id=organization_id,
+            role=role
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_user_organization",
+            set_={
+                "is_active": True,
+                "role": stmt.excluded.role,
+                "updated_at": func.now()
+            },
+            where=Membership.is_active == False
+        ).returning(Membership).execution_options(populate_existing=True)
+
+        result = await self.db.execute(stmt)
+        membership = result.scalar_one_or_none()
+        if membership is None:
+            raise ValueError("User is already a member of this organization")
 
-        # Create membership
-        return await self.add_member(organization_id, user.id, role)
+        await self.db.commit()
+        auth_cache.invalidate(user_id=user.id, organization_id=organization_id)
+        membership_cache.invalidate(user_id=user.id, organization_id=organization_id)
+
+        return membership
 
     async def add_member(
         self,
@@ -372,7 +467,8 @@ class OrganizationsService:
 
         self.db.add(membership)
         await self.db.commit()
-        await self.db.refresh(membership)
+        auth_cache.invalidate(user_id=user_id, organization_id=organization_id)
+        membership_cache.invalidate(user_id=user_id, organization_id=organization_id)
 
         return membership
 
@@ -391,22 +487,21 @@ class OrganizationsService:
         Returns:
             True if removed, False if membership not found
         """
-        membership = await self.get_membership(organization_id, user_id)
+        membership = await self._lock_membership(organization_id, user_id)
         if not membership:
             return False
 
         # Can't remove the last owner
         if membership.role == UserRole.OWNER.value:
-            owner_count = await self.count_members_by_role(
-                organization_id, UserRole.OWNER
-            )
-            if owner_count <= 1:
+            if not await self._has_other_active_owner(organization_id, user_id):
                 raise ValueError(
                     "Cannot remove the last owner of an organization"
                 )
 
         membership.is_active = False
         await self.db.commit()
+        auth_cache.invalidate(user_id=user_id, organization_id=organization_id)
+        membership_cache.invalidate(user_id=user_id, organization_id=organization_id)
 
         return True
 
@@ -430,27 +525,25 @@ class OrganizationsService:
         Raises:
             ValueError: If attempting to change last owner to non-owner
         """
-        if new_role not in UserRole.all():
+        if new_role not in ROLE_RANK:
             raise ValueError(f"Invalid role: {new_role}")
 
-        membership = await self.get_membership(organization_id, user_id)
+        membership = await self._lock_membership(organization_id, user_id)
         if not membership:
             return None
 
         # Check if this would leave org without owner
         old_role = membership.role
         if old_role == UserRole.OWNER.value and new_role != UserRole.OWNER.value:
-            owner_count = await self.count_members_by_role(
-                organization_id, UserRole.OWNER
-            )
-            if owner_count <= 1:
+            if not await self._has_other_active_owner(organization_id, user_id):
                 raise ValueError(
                     "Cannot change the last owner's role"
                 )
 
         membership.role = new_role
         await self.db.commit()
-        await self.db.refresh(membership)
+        auth_cache.invalidate(user_id=user_id, organization_id=organization_id)
+        membership_cache.invalidate(user_id=user_id, organization_id=organization_id)
 
         return membership
 
@@ -462,6 +555,9 @@ class OrganizationsService:
         """
         Get membership record for a user in an organization.
 
+        Served from membership_cache, so use it for read-only permission
+        checks only; writes go through _lock_membership.
+
         Args:
             organization_id: UUID of the organization
             user_id: UUID of the user
@@ -469,14 +565,49 @@ class OrganizationsService:
         Returns:
             Membership object or None
         """
+        cached = await membership_cache.get(self.db, user_id, organization_id)
+        if cached is not None:
+            return cached
+
         result = await self.db.execute(
             select(Membership).where(
-                and_(
-                    Membership.organization_id == organization_id,
-                    Membership.user_id == user_id
-                )
+                Membership.organization_id == organization_id,
+                Membership.user_id == user_id
             )
         )
+        membership = result.scalar_one_or_none()
+        if membership is not None and membership.is_active:
+            membership_cache.set(membership)
+        return membership
+
+    async def _lock_membership(
+        self,
+        organization_id: UUID,
+        user_id: UUID
+    ) -> Optional[Membership]:
+        """
+        Load a membership fresh from the database and lock it for update.
+
+        Bypasses membership_cache: the last-owner guard and the write that
+        follows must see the current role, not a snapshot another worker
+        may still hold.
+
+        Args:
+            organization_id: UUID of the organization
+            user_id: UUID of the user
+
+        Returns:
+            Membership object or None
+        """
+        result = await self.db.execute(
+            select(Membership)
+            .where(
+                Membership.organization_id == organization_id,
+                Membership.user_id == user_id
+            )
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
         return result.scalar_one_or_none()
 
     async def get_organization_members(
@@ -493,11 +624,19 @@ class OrganizationsService:
 
         Returns:
             List of (User, Membership) tuples
+
+        Note:
+            Runs in the caller's transaction on purpose: plain SELECTs take
+            no row locks in PostgreSQL, and the listing route has already
+            queried this session, so the isolation level can no longer be
+            switched to AUTOCOMMIT here.
         """
+        # Both rows come from the join; relationships are never read, so
+        # raise instead of silently lazy-loading one query per member.
         query = select(User, Membership).join(
             Membership,
             Membership.user_id == User.id
-        ).where(
+        ).options(raiseload("*")).where(
             Membership.organization_id == organization_id
         )
 
@@ -524,15 +663,40 @@ class OrganizationsService:
         """
         result = await self.db.execute(
             select(func.count(Membership.id)).where(
-                and_(
-                    Membership.organization_id == organization_id,
-                    Membership.role == role.value,
-                    Membership.is_active == True
-                )
+                Membership.organization_id == organization_id,
+                Membership.role == role.value,
+                Membership.is_active == True
             )
         )
         return result.scalar() or 0
 
+    async def _has_other_active_owner(
+        self,
+        organization_id: UUID,
+        exclude_user_id: UUID
+    ) -> bool:
+        """
+        Check whether an organization has an active owner besides a user.
+
+        Stops at the first matching row instead of counting all owners.
+
+        Args:
+            organization_id: UUID of the organization
+            exclude_user_id: UUID of the user to ignore
+
+        Returns:
+            True if another active owner exists
+        """
+        result = await self.db.execute(
+            select(literal(True)).where(
+                Membership.organization_id == organization_id,
+                Membership.role == UserRole.OWNER.value,
+                Membership.is_active == True,
+                Membership.user_id != exclude_user_id
+            ).limit(1)
+        )
+        return result.scalar() is not None
+
     # ============================================================
     # Permission Checks
     # ============================================================
@@ -559,17 +723,7 @@ class OrganizationsService:
         if not membership or not membership.is_active:
             return False
 
-        role_hierarchy = {
-            UserRole.OWNER: 4,
-            UserRole.ADMIN: 3,
-            UserRole.MEMBER: 2,
-            UserRole.VIEWER: 1
-        }
-
-        user_level = role_hierarchy.get(UserRole(membership.role), 0)
-        required_level = role_hierarchy.get(required_role, 0)
-
-        return user_level >= required_level
+        return ROLE_RANK.get(membership.role, 0) >= ROLE_RANK.get(required_role, 0)
 
     async def can_manage_members(
         self,
@@ -607,12 +761,34 @@ class OrganizationsService:
         organization_id: UUID
     ) -> bool:
         """Check if user is organization owner."""
-        membership = await self.get_membership(organization_id, user_id)
-        return (
-            membership is not None
-            and membership.is_active
-            and membership.role == UserRole.OWNER.value
+        return await self._exists_owner(user_id, organization_id)
+
+    async def _exists_owner(
+        self,
+        user_id: UUID,
+        organization_id: UUID
+    ) -> bool:
+        """
+        Check for an active owner membership without loading the row.
+
+        Args:
+            user_id: UUID of the user
+            organization_id: UUID of the organization
+
+        Returns:
+            True if the user is an active owner of the organization
+        """
+        result = await self.db.execute(
+            select(
+                exists().where(
+                    Membership.organization_id == organization_id,
+                    Membership.user_id == user_id,
+                    Membership.is_active == True,
+                    Membership.role == UserRole.OWNER.value
+                )
+            )
         )
+        return result.scalar()
 
     # ============================================================
     # Organization Statistics
@@ -631,38 +807,42 @@ class OrganizationsService:
         Returns:
             Dict with organization statistics
         """
-        # Member counts
-        total_members = await self.count_members_by_role(
-            organization_id, UserRole.MEMBER
-        )
-        admin_count = await self.count_members_by_role(
-            organization_id, UserRole.ADMIN
-        )
-        owner_count = await self.count_members_by_role(
-            organization_id, UserRole.OWNER
-        )
-        viewer_count = await self.count_members_by_role(
-            organization_id, UserRole.VIEWER
-        )
+        # Member counts per role and the dialog count in one round trip
+        dialog_count = select(func.count(Dialog.id)).where(
+            Dialog.owner_type == "organization",
+            Dialog.owner_id == organization_id
+        ).scalar_subquery()
 
-        # Dialog count
-        dialog_result = await self.db.execute(
-            select(func.count(Dialog.id)).where(
-                and_(
-                    Dialog.owner_type == "organization",
-                    Dialog.owner_id == organization_id
-                )
+        result = await self.db.execute(
+            select(
+                func.count(Membership.id).label("total"),
+                func.count(Membership.id).filter(
+                    Membership.role == UserRole.OWNER.value
+                ).label("owners"),
+                func.count(Membership.id).filter(
+                    Membership.role == UserRole.ADMIN.value
+                ).label("admins"),
+                func.count(Membership.id).filter(
+                    Membership.role == UserRole.MEMBER.value
+                ).label("members"),
+                func.count(Membership.id).filter(
+                    Membership.role == UserRole.VIEWER.value
+                ).label("viewers"),
+                dialog_count.label("dialogs")
+            ).where(
+                Membership.organization_id == organization_id,
+                Membership.is_active == True
             )
         )
-        dialog_count = dialog_result.scalar() or 0
+        row = result.one()
 
         return {
-            "total_members": total_members + admin_count + owner_count + viewer_count,
-            "owners": owner_count,
-            "admins": admin_count,
-            "members": total_members,
-            "viewers": viewer_count,
-            "dialogs": dialog_count
+            "total_members": row.total,
+            "owners": row.owners,
+            "admins": row.admins,
+            "members": row.members,
+            "viewers": row.viewers,
+            "dialogs": row.dialogs or 0
         }
 
     # ============================================================
@@ -679,32 +859,19 @@ class OrganizationsService:
         Returns:
             URL-safe slug with random suffix
         """
-        import re
-        base = re.sub(r'[^\w\s-]', '', name).strip().lower()
-        base = re.sub(r'[-\s]+', '-', base)
-        suffix = uuid4().hex[:6]
-        return f"{base}-{suffix}"
+        base = slugify(name)
+        return f"{base}-{uuid4().hex[:6]}"
 
-    async def _generate_access_code(self) -> str:
+    def _generate_access_code(self) -> str:
         """
-        Generate unique 6-character access code for organization.
+        Generate a random 6-character access code for an organization.
+
+        Uniqueness is enforced by the database; see create_organization.
 
         Returns:
             6-character uppercase code (letters + numbers)
         """
-        import random
-        import string
-
-        while True:
-            # Generate 6-character code
-            code = ''.join(random.choices('ABCDEFGHJKLMNPQRSTUVWXYZ23456789', k=6))
-
-            # Check uniqueness
-            existing = await self.db.execute(
-                select(Organization.id).where(Organization.access_code == code)
-            )
-            if not existing.scalar_one_or_none():
-                return code
+        return bytes(ACCESS_CODE_ALPHABET[b & 31] for b in os.urandom(6)).decode()
 
     async def get_user_organizations(
         self,
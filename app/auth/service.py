@@ -11,17 +11,155 @@ Provides core authentication functionality including:
 This service is used by API endpoints to handle all auth operations.
 """
 
-from jose import jwt
-from datetime import datetime, timedelta, timezone
+import base64
+import binascii
+import hmac
+import time
+
+import jwt
+import orjson
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 from uuid import uuid4, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, delete, and_, exists
+from sqlalchemy.orm import undefer
 from sqlalchemy.exc import IntegrityError
 
 from ..database.models import Base
-from .models import User, Organization, Membership, Session, UserRole
-from ..config import settings
+from .models import User, Organization, Membership, Session, UserRole, verify_dummy_async, slugify
+from .cache import auth_cache, token_cache
+from ..config import settings, JWT_SECRET_BYTES, JWT_ALGORITHM, ACCESS_EXP_DELTA, REFRESH_EXP_DELTA
+
+# Active-row filters shared by the queries below, built once at import
+_USER_ACTIVE = User.is_active == True
+_SESSION_ACTIVE = Session.is_active == True
+_MEMBERSHIP_ACTIVE = Membership.is_active == True
+_ORGANIZATION_ACTIVE = Organization.is_active == True
+
+
+# HMAC algorithms signed directly; anything else goes through jwt.encode
+_HMAC_DIGESTS = {"HS256": "sha256", "HS384": "sha384", "HS512": "sha512"}
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as JWS requires."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# Encoded JOSE header and HMAC digest; identical for every token
+_JWT_HEADER = _b64url(orjson.dumps({"alg": JWT_ALGORITHM, "typ": "JWT"}))
+_JWT_DIGEST = _HMAC_DIGESTS.get(JWT_ALGORITHM)
+
+
+def _encode_token(payload: Dict[str, Any]) -> str:
+    """
+    Sign a token payload.
+
+    For HS* algorithms the token is assembled from the cached header
+    segment, the encoded payload and an hmac.digest signature, skipping
+    the per-call header serialisation in jwt.encode.
+
+    Args:
+        payload: JWT claims
+
+    Returns:
+        Compact JWS string
+    """
+    if _JWT_DIGEST is None:
+        return jwt.encode(payload, JWT_SECRET_BYTES, algorithm=JWT_ALGORITHM)
+
+    signing_input = _JWT_HEADER + b"." + _b64url(orjson.dumps(payload))
+    signature = hmac.digest(JWT_SECRET_BYTES, signing_input, _JWT_DIGEST)
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
+
+
+# Claims every token must carry
+_REQUIRED_CLAIMS = ("exp", "iat", "sub", "jti", "type")
+_DECODE_OPTIONS = {"require": list(_REQUIRED_CLAIMS)}
+
+
+def _b64url_decode(segment: bytes) -> bytes:
+    """Decode an unpadded base64url segment."""
+    try:
+        return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+    except (binascii.Error, ValueError):
+        raise jwt.DecodeError("Invalid base64 segment")
+
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    """
+    Verify a token and return its claims.
+
+    Tokens carrying the cached HS* header are checked directly: one
+    hmac.digest plus compare_digest for the signature, then the claims we
+    issue (required claims, exp, iat, nbf). Any other token goes through
+    jwt.decode. Errors are raised as PyJWT exceptions in both cases.
+
+    Args:
+        token: Compact JWS string
+
+    Returns:
+        Decoded payload
+
+    Raises:
+        jwt.InvalidTokenError: If the token is malformed, forged or expired
+    """
+    try:
+        raw = token.encode("ascii")
+    except (AttributeError, UnicodeEncodeError):
+        raise jwt.DecodeError("Invalid token type")
+
+    header, _, rest = raw.partition(b".")
+    if _JWT_DIGEST is None or header != _JWT_HEADER:
+        return jwt.decode(token, JWT_SECRET_BYTES, algorithms=[JWT_ALGORITHM], options=_DECODE_OPTIONS)
+
+    claims, _, signature = rest.partition(b".")
+    if not signature or b"." in signature:
+        raise jwt.DecodeError("Not enough segments")
+
+    expected = hmac.digest(JWT_SECRET_BYTES, raw[:len(header) + 1 + len(claims)], _JWT_DIGEST)
+    if not hmac.compare_digest(expected, _b64url_decode(signature)):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    try:
+        payload = orjson.loads(_b64url_decode(claims))
+    except orjson.JSONDecodeError:
+        raise jwt.DecodeError("Invalid payload")
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload")
+
+    for claim in _REQUIRED_CLAIMS:
+        if claim not in payload:
+            raise jwt.MissingRequiredClaimError(claim)
+
+    now = time.time()
+    for claim in ("exp", "iat", "nbf"):
+        value = payload.get(claim)
+        if value is not None and (
+            isinstance(value, bool) or not isinstance(value, (int, float))
+        ):
+            raise jwt.DecodeError(f"The {claim} claim must be a number")
+
+    if payload["exp"] <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    if payload["iat"] > now or payload.get("nbf", now) > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid")
+
+    return payload
+
+
+class TokenTypeError(ValueError):
+    """Raised when a valid token of the wrong type is presented."""
+    pass
+
+
+def _parse_jti(jti: Optional[str]) -> Optional[UUID]:
+    """Parse a JTI claim into the UUID stored on Session, None if malformed."""
+    try:
+        return UUID(jti)
+    except (TypeError, ValueError, AttributeError):
+        return None
 
 
 class AuthService:
@@ -92,12 +230,11 @@ class AuthService:
             email=email,
             full_name=full_name
         )
-        user.set_password(password)
+        await user.set_password_async(password)
 
         self.db.add(user)
         try:
             await self.db.commit()
-            await self.db.refresh(user)
         except IntegrityError:
             await self.db.rollback()
             raise ValueError("User with this username or email already exists")
@@ -119,78 +256,157 @@ class AuthService:
         )
         return result.scalar_one_or_none()
 
-    async def get_user_by_email(self, email: str) -> Optional[User]:
+    async def get_user_by_email(
+        self,
+        email: str,
+        with_password: bool = False
+    ) -> Optional[User]:
         """
         Get user by email address.
 
         Args:
             email: User email address
+            with_password: Also load the deferred password hash
 
         Returns:
             User object or None if not found
         """
-        result = await self.db.execute(
-            select(User).where(
-                and_(User.email == email, User.is_active == True)
-            )
+        query = select(User).where(
+            and_(User.email == email, _USER_ACTIVE)
         )
+        if with_password:
+            query = query.options(undefer(User.password_hash))
+
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    async def get_user_by_username(self, username: str) -> Optional[User]:
+    async def get_user_by_username(
+        self,
+        username: str,
+        with_password: bool = False
+    ) -> Optional[User]:
         """
         Get user by username.
 
         Args:
             username: User username
+            with_password: Also load the deferred password hash
 
         Returns:
             User object or None if not found
         """
-        result = await self.db.execute(
-            select(User).where(
-                and_(User.username == username, User.is_active == True)
-            )
+        query = select(User).where(
+            and_(User.username == username, _USER_ACTIVE)
         )
+        if with_password:
+            query = query.options(undefer(User.password_hash))
+
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_user_with_membership(
+        self,
+        organization_id: Optional[UUID],
+        email: Optional[str] = None,
+        username: Optional[str] = None
+    ) -> tuple[Optional[User], Optional[Membership]]:
+        """
+        Get an active user for login together with their membership.
+
+        User and membership come back from one outer-joined SELECT, with
+        the deferred password hash loaded.
+
+        Args:
+            organization_id: Organization to load the membership for (optional)
+            email: User email address
+            username: User username (used when email is not given)
+
+        Returns:
+            Tuple of (User or None, Membership or None)
+        """
+        login_clause = User.email == email if email is not None else User.username == username
+        query = (
+            select(User)
+            .where(login_clause, _USER_ACTIVE)
+            .options(undefer(User.password_hash))
+        )
+        if organization_id is not None:
+            query = query.add_columns(Membership).outerjoin(
+                Membership,
+                and_(
+                    Membership.user_id == User.id,
+                    Membership.organization_id == organization_id
+                )
+            )
+
+        row = (await self.db.execute(query)).first()
+        if row is None:
+            return None, None
+        return row[0], row[1] if organization_id is not None else None
+
     async def update_last_login(self, user: User) -> None:
         """
         Update user's last login timestamp.
 
+        Only marks the change; it is written by the caller's next commit,
+        which for login is the one that stores the new session.
+
         Args:
             user: User object to update
         """
         user.last_login_at = datetime.now(timezone.utc)
-        await self.db.commit()
 
     # ============================================================
     # Authentication Operations
     # ============================================================
 
-    async def authenticate(
+    async def _check_password(
         self,
-        email: str,
+        user: Optional[User],
         password: str
     ) -> Optional[User]:
         """
-        Authenticate user with email and password.
+        Verify a password against a user loaded with its password hash.
 
         Args:
-            email: User email address
+            user: User object, or None if the login was not found
             password: Plain text password
 
         Returns:
-            User object if authentication successful, None otherwise
+            User object if the password matches, None otherwise
         """
-        user = await self.get_user_by_email(email)
         if not user:
+            # Spend the same bcrypt time as a wrong password
+            await verify_dummy_async(password)
             return None
 
-        if not user.verify_password(password):
+        if not await user.verify_password_async(password):
             return None
 
+        # Move the hash to the current BCRYPT_ROUNDS; written by the login commit
+        if user.password_needs_rehash():
+            await user.set_password_async(password)
+
         return user
 
+    async def authenticate(
+        self,
+        email: str,
+        password: str
+    ) -> Optional[User]:
+        """
+        Authenticate user with email and password.
+
+        Args:
+            email: User email address
+            password: Plain text password
+
+        Returns:
+            User object if authentication successful, None otherwise
+        """
+        user = await self.get_user_by_email(email, with_password=True)
+        return await self._check_password(user, password)
+
     async def authenticate_by_username(
         self,
         username: str,
@@ -206,14 +422,8 @@ class AuthService:
         Returns:
             User object if authentication successful, None otherwise
         """
-        user = await self.get_user_by_username(username)
-        if not user:
-            return None
-
-        if not user.verify_password(password):
-            return None
-
-        return user
+        user = await self.get_user_by_username(username, with_password=True)
+        return await self._check_password(user, password)
 
     # ============================================================
     # Token Operations
@@ -223,7 +433,7 @@ class AuthService:
         self,
         user_id: UUID,
         organization_id: Optional[UUID] = None
-    ) -> tuple[str, str]:
+    ) -> tuple[str, UUID]:
         """
         Create JWT access token.
 
@@ -232,15 +442,15 @@ class AuthService:
             organization_id: Optional currently selected organization
 
         Returns:
-            Tuple of (token_string, jti_claim)
+            Tuple of (token_string, jti)
         """
-        jti = str(uuid4())
+        jti = uuid4()
         now = datetime.now(timezone.utc)
-        exp = now + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+        exp = now + ACCESS_EXP_DELTA
 
         payload = {
             "sub": str(user_id),
-            "jti": jti,
+            "jti": str(jti),
             "iat": now.timestamp(),
             "exp": exp.timestamp(),
             "type": "access"
@@ -249,18 +459,14 @@ class AuthService:
         if organization_id:
             payload["org_id"] = str(organization_id)
 
-        token = jwt.encode(
-            payload,
-            settings.JWT_SECRET_KEY,
-            algorithm=settings.JWT_ALGORITHM
-        )
+        token = _encode_token(payload)
 
         return token, jti
 
     def create_refresh_token(
         self,
         user_id: UUID
-    ) -> tuple[str, str]:
+    ) -> tuple[str, UUID]:
         """
         Create JWT refresh token.
 
@@ -268,113 +474,116 @@ class AuthService:
             user_id: UUID of the user
 
         Returns:
-            Tuple of (token_string, jti_claim)
+            Tuple of (token_string, jti)
         """
-        jti = str(uuid4())
+        jti = uuid4()
         now = datetime.now(timezone.utc)
-        exp = now + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+        exp = now + REFRESH_EXP_DELTA
 
         payload = {
             "sub": str(user_id),
-            "jti": jti,
+            "jti": str(jti),
             "iat": now.timestamp(),
             "exp": exp.timestamp(),
             "type": "refresh"
         }
 
-        token = jwt.encode(
-            payload,
-            settings.JWT_SECRET_KEY,
-            algorithm=settings.JWT_ALGORITHM
-        )
+        token = _encode_token(payload)
 
         return token, jti
 
-    def decode_token(self, token: str) -> Dict[str, Any]:
+    def decode_token(self, token: str, token_type: str) -> Dict[str, Any]:
         """
         Decode and validate JWT token.
 
+        Signature, expiry, presence of every standard claim and the token
+        type are all checked in this single decode.
+
         Args:
             token: JWT token string
+            token_type: Expected token type ("access" or "refresh")
 
         Returns:
             Decoded token payload
 
         Raises:
+            TokenTypeError: If the token is valid but of another type
             ValueError: If token is invalid or expired
         """
-        try:
-            payload = jwt.decode(
-                token,
-                settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM]
-            )
-            return payload
-        except jwt.ExpiredSignatureError:
-            raise ValueError("Token has expired")
-        except jwt.InvalidTokenError as e:
-            raise ValueError(f"Invalid token: {str(e)}")
-
-    def verify_token_type(self, payload: Dict[str, Any], token_type: str) -> bool:
-        """
-        Verify token has correct type claim.
+        payload = token_cache.get(token)
+        if payload is None:
+            try:
+                payload = _decode_token(token)
+            except jwt.ExpiredSignatureError:
+                raise ValueError("Token has expired")
+            except jwt.InvalidTokenError as e:
+                raise ValueError(f"Invalid token: {str(e)}")
+            token_cache.set(token, payload)
 
-        Args:
-            payload: Decoded token payload
-            token_type: Expected token type ("access" or "refresh")
+        if payload["type"] != token_type:
+            raise TokenTypeError(f"Expected {token_type} token")
 
-        Returns:
-            True if type matches, False otherwise
-        """
-        return payload.get("type") == token_type
+        return payload
 
     # ============================================================
     # Session Operations
     # ============================================================
 
-    async def create_session(
+    def _new_session(
         self,
         user_id: UUID,
         organization_id: Optional[UUID] = None
     ) -> Session:
         """
-        Create a new session with access and refresh tokens.
+        Build an unsaved session with freshly issued tokens.
 
         Args:
             user_id: UUID of the user
             organization_id: Optional selected organization
 
         Returns:
-            Created Session object with tokens
+            Session object with access_token/refresh_token attached
         """
         # Create tokens
         access_token, access_jti = self.create_access_token(user_id, organization_id)
         refresh_token, refresh_jti = self.create_refresh_token(user_id)
 
-        # Calculate expiration
-        expires_at = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-
         # Create session record
         session = Session(
             user_id=user_id,
             token_jti=access_jti,
             refresh_token_jti=refresh_jti,
             organization_id=organization_id,
-            expires_at=expires_at
+            expires_at=datetime.now(timezone.utc) + ACCESS_EXP_DELTA
         )
 
-        self.db.add(session)
-        await self.db.commit()
-        await self.db.refresh(session)
-
         # Attach tokens to session object (not stored in DB)
         session.access_token = access_token
         session.refresh_token = refresh_token
 
         return session
 
+    async def create_session(
+        self,
+        user_id: UUID,
+        organization_id: Optional[UUID] = None
+    ) -> Session:
+        """
+        Create a new session with access and refresh tokens.
+
+        Args:
+            user_id: UUID of the user
+            organization_id: Optional selected organization
+
+        Returns:
+            Created Session object with tokens
+        """
+        session = self._new_session(user_id, organization_id)
+        self.db.add(session)
+        await self.db.commit()
+
+        return session
+
     async def get_session_by_jti(self, jti: str) -> Optional[Session]:
         """
         Get session by access token JTI.
@@ -385,16 +594,79 @@ class AuthService:
         Returns:
             Session object or None if not found
         """
+        jti_uuid = _parse_jti(jti)
+        if jti_uuid is None:
+            return None
+
         result = await self.db.execute(
             select(Session).where(
                 and_(
-                    Session.token_jti == jti,
-                    Session.is_active == True
+                    Session.token_jti == jti_uuid,
+                    _SESSION_ACTIVE
                 )
             )
         )
         return result.scalar_one_or_none()
 
+    async def resolve_full_context(
+        self,
+        user_id: UUID,
+        jti: UUID,
+        organization_id: Optional[UUID] = None
+    ) -> Optional[tuple[User, Session, Optional[Organization], Optional[Membership]]]:
+        """
+        Load user, active session and organization membership in one query.
+
+        Args:
+            user_id: UUID of the user (token "sub" claim)
+            jti: JWT ID claim from access token, parsed to UUID
+            organization_id: Optional selected organization (token "org_id" claim)
+
+        Returns:
+            Tuple of (User, Session, Organization, Membership) or None if the
+            user or active session is not found. Organization and Membership
+            are None when no organization is selected or the user is not an
+            active member of it.
+        """
+        cache_key = (user_id, jti, organization_id)
+        cached = await auth_cache.get(self.db, cache_key)
+        if cached:
+            return cached
+
+        query = select(User, Session).join(
+            Session,
+            and_(
+                Session.user_id == User.id,
+                Session.token_jti == jti,
+                Session.is_valid
+            )
+        ).where(User.id == user_id)
+
+        if organization_id:
+            query = query.add_columns(Organization, Membership).outerjoin(
+                Membership,
+                and_(
+                    Membership.user_id == User.id,
+                    Membership.organization_id == organization_id,
+                    _MEMBERSHIP_ACTIVE
+                )
+            ).outerjoin(
+                Organization, Organization.id == Membership.organization_id
+            )
+
+        row = (await self.db.execute(query)).first()
+        if not row:
+            return None
+
+        if organization_id:
+            context = tuple(row)
+        else:
+            user, session = row
+            context = (user, session, None, None)
+
+        auth_cache.set(cache_key, context)
+        return context
+
     async def get_session_by_refresh_jti(self, jti: str) -> Optional[Session]:
         """
         Get session by refresh token JTI.
@@ -405,11 +677,15 @@ class AuthService:
         Returns:
             Session object or None if not found
         """
+        jti_uuid = _parse_jti(jti)
+        if jti_uuid is None:
+            return None
+
         result = await self.db.execute(
             select(Session).where(
                 and_(
-                    Session.refresh_token_jti == jti,
-                    Session.is_active == True
+                    Session.refresh_token_jti == jti_uuid,
+                    _SESSION_ACTIVE
                 )
             )
         )
@@ -424,6 +700,7 @@ class AuthService:
         """
         session.is_active = False
         await self.db.commit()
+        auth_cache.invalidate(jti=session.token_jti)
 
     async def revoke_user_sessions(
         self,
@@ -440,25 +717,20 @@ class AuthService:
         Returns:
             Number of sessions revoked
         """
-        query = select(Session).where(
+        stmt = update(Session).where(
             and_(
                 Session.user_id == user_id,
-                Session.is_active == True
+                _SESSION_ACTIVE
             )
-        )
-
-        result = await self.db.execute(query)
-        sessions = result.scalars().all()
+        ).values(is_active=False)
 
-        count = 0
-        for session in sessions:
-            if exclude_session_id and session.id == exclude_session_id:
-                continue
-            session.is_active = False
-            count += 1
+        if exclude_session_id:
+            stmt = stmt.where(Session.id != exclude_session_id)
 
+        result = await self.db.execute(stmt)
         await self.db.commit()
-        return count
+        auth_cache.invalidate(user_id=user_id)
+        return result.rowcount
 
     async def cleanup_expired_sessions(self) -> int:
         """
@@ -467,7 +739,6 @@ class AuthService:
         Returns:
             Number of sessions deleted
         """
-        from sqlalchemy import delete
 
         stmt = delete(Session).where(
             Session.expires_at < datetime.now(timezone.utc)
@@ -500,19 +771,17 @@ class AuthService:
         Raises:
             ValueError: If authentication fails
         """
-        user = await self.authenticate(email, password)
-        if not user:
+        user, membership = await self.get_user_with_membership(organization_id, email=email)
+        if not await self._check_password(user, password):
             raise ValueError("Invalid email or password")
 
         # Verify organization membership if specified
         if organization_id:
-            if not await self.is_organization_member(user.id, organization_id):
+            if membership is None or not membership.is_active:
                 raise ValueError("User is not a member of this organization")
 
-        # Update last login
+        # Update last login and create session in one commit
         await self.update_last_login(user)
-
-        # Create session
         session = await self.create_session(user.id, organization_id)
 
         return session, user
@@ -537,18 +806,16 @@ class AuthService:
         Raises:
             ValueError: If authentication fails
         """
-        user = await self.authenticate_by_username(username, password)
-        if not user:
+        user, membership = await self.get_user_with_membership(organization_id, username=username)
+        if not await self._check_password(user, password):
             raise ValueError("Invalid username or password")
 
         # Verify organization membership
-        if not await self.is_organization_member(user.id, organization_id):
+        if membership is None or not membership.is_active:
             raise ValueError("User is not a member of this organization")
 
-        # Update last login
+        # Update last login and create session in one commit
         await self.update_last_login(user)
-
-        # Create session with organization
         session = await self.create_session(user.id, organization_id)
 
         return session, user
@@ -579,21 +846,33 @@ class AuthService:
         Returns:
             Tuple of (new Session, User) or None if refresh fails
         """
-        session = await self.get_session_by_refresh_jti(refresh_jti)
-        if not session:
+        jti_uuid = _parse_jti(refresh_jti)
+        if jti_uuid is None:
             return None
 
-        user = await self.get_user_by_id(session.user_id)
-        if not user or not user.is_active:
+        # Session and its (active) user in one SELECT; the row lock makes a
+        # concurrent refresh with the same token wait and then find nothing
+        result = await self.db.execute(
+            select(Session, User)
+            .join(User, Session.user_id == User.id)
+            .where(
+                Session.refresh_token_jti == jti_uuid,
+                _SESSION_ACTIVE,
+                _USER_ACTIVE
+            )
+            .with_for_update(of=Session)
+        )
+        row = result.first()
+        if row is None:
             return None
+        session, user = row
 
-        # Revoke old session and create new one
-        await self.revoke_session(session)
-
-        new_session = await self.create_session(
-            user.id,
-            session.organization_id
-        )
+        # Revoke old session and store the new one in one commit
+        session.is_active = False
+        new_session = self._new_session(user.id, session.organization_id)
+        self.db.add(new_session)
+        await self.db.commit()
+        auth_cache.invalidate(jti=session.token_jti)
 
         return new_session, user
 
@@ -617,15 +896,17 @@ class AuthService:
             True if user is an active member, False otherwise
         """
         result = await self.db.execute(
-            select(Membership).where(
-                and_(
-                    Membership.user_id == user_id,
-                    Membership.organization_id == organization_id,
-                    Membership.is_active == True
+            select(
+                exists().where(
+                    and_(
+                        Membership.user_id == user_id,
+                        Membership.organization_id == organization_id,
+                        _MEMBERSHIP_ACTIVE
+                    )
                 )
             )
         )
-        return result.scalar_one_or_none() is not None
+        return result.scalar()
 
     async def get_user_organizations(self, user_id: UUID) -> list[Organization]:
         """
@@ -643,8 +924,8 @@ class AuthService:
             .where(
                 and_(
                     Membership.user_id == user_id,
-                    Membership.is_active == True,
-                    Organization.is_active == True
+                    _MEMBERSHIP_ACTIVE,
+                    _ORGANIZATION_ACTIVE
                 )
             )
         )
@@ -769,7 +1050,5 @@ class AuthService:
         Returns:
             URL-safe slug string
         """
-        import re
-        base = re.sub(r'[^\w\s-]', '', name).strip().lower()
-        base = re.sub(r'[-\s]+', '-', base)
+        base = slugify(name)
         return f"{base}-{uuid4().hex[:8]}"
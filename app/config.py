@@ -21,6 +21,7 @@ Usage:
 """
 
 import os
+from datetime import timedelta
 from typing import Optional
 from functools import lru_cache
 
@@ -55,11 +56,27 @@ class Settings:
     # Password Security
     PASSWORD_MIN_LENGTH: int = int(os.getenv("PASSWORD_MIN_LENGTH", "8"))
     PASSWORD_MAX_LENGTH: int = int(os.getenv("PASSWORD_MAX_LENGTH", "128"))
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
 
     # Session Configuration
     SESSION_EXPIRE_HOURS: int = int(os.getenv("SESSION_EXPIRE_HOURS", "24"))
     MAX_SESSIONS_PER_USER: int = int(os.getenv("MAX_SESSIONS_PER_USER", "10"))
 
+    # Database Pool (per worker process: size x workers must fit max_connections)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # Lower (e.g. 300) behind managed databases/proxies that drop idle connections
+    DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "3600"))
+
+    # Auth Context Cache (per-process; keep TTL short with multiple workers)
+    AUTH_CACHE_ENABLED: bool = os.getenv(
+        "AUTH_CACHE_ENABLED",
+        "false"
+    ).lower() in ("true", "1", "yes", "on")
+    AUTH_CACHE_TTL_SECONDS: int = int(os.getenv("AUTH_CACHE_TTL_SECONDS", "30"))
+    AUTH_CACHE_MAX_ENTRIES: int = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
+
     # Organization Settings
     MAX_ORGANIZATIONS_PER_USER: int = int(
         os.getenv("MAX_ORGANIZATIONS_PER_USER", "10")
@@ -108,3 +125,9 @@ settings = get_settings()
 # Direct exports for commonly used values
 FEATURE_FLAG_AUTH = settings.FEATURE_FLAG_AUTH
 AUTH_ENABLED = settings.auth_enabled
+
+# Token settings read on every token operation, resolved once at import
+JWT_SECRET_BYTES = settings.JWT_SECRET_KEY.encode("utf-8")
+JWT_ALGORITHM = settings.JWT_ALGORITHM
+ACCESS_EXP_DELTA = timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+REFRESH_EXP_DELTA = timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.orm import declarative_base
 
 from .models import Base
+from ..config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,8 @@ class DatabaseConfig:
         max_overflow: int = 30,
         pool_timeout: int = 30,
         pool_recycle: int = 3600,
+        pool_pre_ping: bool = True,
+        pool_use_lifo: bool = True,
         echo: bool = False
     ):
         """
@@ -45,6 +48,10 @@ class DatabaseConfig:
             max_overflow: Maximum overflow connections
             pool_timeout: Timeout for getting connection from pool
             pool_recycle: Connection recycle time in seconds
+            pool_pre_ping: Check connections for liveness on checkout
+            pool_use_lifo: Hand out the most recently returned connection first;
+                the unused tail stays idle, so server-side idle timeouts may
+                close it and pool_pre_ping replaces such connections on checkout
             echo: Enable SQL logging for debugging
         """
         self.db_url = db_url
@@ -52,6 +59,8 @@ class DatabaseConfig:
         self.max_overflow = max_overflow
         self.pool_timeout = pool_timeout
         self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        self.pool_use_lifo = pool_use_lifo
         self.echo = echo
 
 
@@ -86,6 +95,8 @@ class DatabaseManager:
             max_overflow=self.config.max_overflow,
             pool_timeout=self.config.pool_timeout,
             pool_recycle=self.config.pool_recycle,
+            pool_pre_ping=self.config.pool_pre_ping,
+            pool_use_lifo=self.config.pool_use_lifo,
             echo=self.config.echo,
             future=True,
         )
@@ -102,7 +113,11 @@ class DatabaseManager:
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
-        logger.info("Database initialized successfully")
+        logger.info(
+            f"Database initialized successfully "
+            f"(pool_size={self.config.pool_size}, max_overflow={self.config.max_overflow}, "
+            f"pool_recycle={self.config.pool_recycle}s, pool_use_lifo={self.config.pool_use_lifo})"
+        )
 
     async def close(self) -> None:
         """
@@ -112,6 +127,17 @@ class DatabaseManager:
             await self._engine.dispose()
             logger.info("Database engine closed")
 
+    def pool_status(self) -> str:
+        """
+        Describe current pool usage (checked in/out, overflow).
+
+        Returns:
+            Pool status string
+        """
+        if not self._engine:
+            return "not initialized"
+        return self._engine.pool.status()
+
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """
@@ -163,10 +189,10 @@ async def init_db(db_url: str) -> None:
 
     config = DatabaseConfig(
         db_url=db_url,
-        pool_size=20,
-        max_overflow=30,
-        pool_timeout=30,
-        pool_recycle=3600,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
         echo=False  # Set to True for debugging
     )
 
@@ -227,7 +253,11 @@ async def health_check() -> dict:
             if result.scalar() != 1:
                 return {"status": "error", "message": "Invalid response from database"}
 
-            return {"status": "healthy", "message": "Database connection successful"}
+            return {
+                "status": "healthy",
+                "message": "Database connection successful",
+                "pool": _db_manager.pool_status()
+            }
 
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
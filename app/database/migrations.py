@@ -0,0 +1,129 @@
+"""
+Helpers shared by Alembic migration scripts.
+
+Migration files live outside the application package, so reusable DDL
+helpers are kept here and imported by the revisions that need them.
+"""
+
+import logging
+from typing import Optional, Sequence
+
+import sqlalchemy as sa
+from alembic import context, op
+
+logger = logging.getLogger(__name__)
+
+# Maximum attempts for building a concurrent index before giving up
+CONCURRENT_INDEX_RETRIES = 3
+
+
+def _index_is_valid(name: str) -> Optional[bool]:
+    """
+    Check the pg_index validity flag of an index.
+
+    Args:
+        name: Index name
+
+    Returns:
+        True/False for an existing index, None if the index does not exist
+    """
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name"
+        ),
+        {"name": name}
+    ).scalar()
+
+
+def create_index_concurrently(
+    name: str,
+    table: str,
+    columns: Sequence[str],
+    unique: bool = False,
+    where: Optional[str] = None,
+    include: Optional[Sequence[str]] = None,
+    retries: int = CONCURRENT_INDEX_RETRIES
+) -> None:
+    """
+    Build an index with CREATE INDEX CONCURRENTLY.
+
+    The build runs in an autocommit block because PostgreSQL refuses to
+    run CONCURRENTLY inside a transaction. A failed concurrent build
+    leaves an INVALID index behind, so the index state is checked after
+    every attempt and rebuilt with REINDEX INDEX CONCURRENTLY if needed.
+
+    Args:
+        name: Index name
+        table: Table to index
+        columns: Column names (or expressions) in index order
+        unique: Create a unique index
+        where: Optional predicate for a partial index
+        include: Optional non-key columns for a covering index
+        retries: Maximum number of build attempts
+
+    Raises:
+        RuntimeError: If the index is still invalid after all attempts
+    """
+    create_sql = "CREATE {unique}INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})".format(
+        unique="UNIQUE " if unique else "",
+        name=name,
+        table=table,
+        columns=", ".join(columns),
+    )
+    if include:
+        create_sql += f" INCLUDE ({', '.join(include)})"
+    if where:
+        create_sql += f" WHERE {where}"
+
+    with op.get_context().autocommit_block():
+        if context.is_offline_mode():
+            op.execute(create_sql)
+            return
+
+        for attempt in range(1, retries + 1):
+            try:
+                if _index_is_valid(name) is False:
+                    op.execute(f"REINDEX INDEX CONCURRENTLY {name}")
+                else:
+                    op.execute(create_sql)
+            except sa.exc.DBAPIError as e:
+                logger.warning(f"Concurrent build of {name} failed (attempt {attempt}): {e}")
+                if attempt == retries:
+                    raise
+
+            if _index_is_valid(name):
+                return
+
+        raise RuntimeError(f"Index {name} is still INVALID after {retries} attempts")
+
+
+def rebuild_index_concurrently(
+    name: str,
+    table: str,
+    columns: Sequence[str],
+    where: Optional[str] = None,
+    include: Optional[Sequence[str]] = None
+) -> None:
+    """
+    Replace an existing index with a new definition under the same name.
+
+    The new index is built as {name}_new with create_index_concurrently,
+    the old one is removed with DROP INDEX CONCURRENTLY and the new one is
+    renamed into place, so writes are never blocked and lookups always
+    have one of the two indexes. Safe to re-run after a partial failure.
+
+    Args:
+        name: Index name
+        table: Table to index
+        columns: Column names (or expressions) in index order
+        where: Optional predicate for a partial index
+        include: Optional non-key columns for a covering index
+    """
+    new_name = f"{name}_new"
+    create_index_concurrently(new_name, table, columns, where=where, include=include)
+
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        op.execute(f"ALTER INDEX {new_name} RENAME TO {name}")
@@ -18,17 +18,22 @@ Models:
 - DialogAnalysis: Stores analysis results with scores and recommendations
 """
 
-from sqlalchemy import Column, String, DateTime, Float, Text, Integer, ForeignKey, Boolean, JSON
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, DateTime, Float, Text, Integer, ForeignKey, Boolean, JSON, Index
+from sqlalchemy.ext.asyncio import AsyncAttrs
+from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ENUM
 from sqlalchemy.sql import func
 import uuid
 from typing import Optional
 
 
 
-Base = declarative_base()
+# AsyncAttrs adds instance.awaitable_attrs for loading lazy/deferred
+# attributes under AsyncSession
+Base = declarative_base(cls=AsyncAttrs)
+
+# Native enum shared by every polymorphic owner_type column
+OwnerKind = ENUM('organization', 'user', name='owner_kind')
 
 
 class Dialog(Base):
@@ -57,7 +62,7 @@ class Dialog(Base):
     __tablename__ = "dialogs"
 
     # Primary key with UUID for performance
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     # File metadata
     filename = Column(String(255), nullable=False, index=True,
@@ -82,7 +87,7 @@ class Dialog(Base):
     # Organization/User ownership (for multi-tenancy when auth is enabled)
     # These fields are nullable for backward compatibility
     # When FEATURE_FLAG_AUTH=False, these remain NULL (legacy mode)
-    owner_type = Column(String(50), nullable=True, index=True,
+    owner_type = Column(OwnerKind, nullable=True, index=True,
                        comment="Owner type: 'organization', 'user', or None (legacy)")
     owner_id = Column(UUID(as_uuid=True), nullable=True, index=True,
                      comment="Owner ID (organization_id or user_id when auth enabled)")
@@ -187,7 +192,7 @@ class Transcription(Base):
     __tablename__ = "transcriptions"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     # Foreign key to Dialog
     dialog_id = Column(UUID(as_uuid=True), ForeignKey("dialogs.id"),
@@ -233,7 +238,7 @@ class DialogAnalysis(Base):
     __tablename__ = "dialog_analyses"
 
     # Primary key with unique constraint per dialog
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     # Foreign key to Dialog (one analysis per dialog)
     dialog_id = Column(UUID(as_uuid=True), ForeignKey("dialogs.id"),
@@ -285,10 +290,10 @@ class Company(Base):
     """
     __tablename__ = "companies"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     # Multi-tenancy ownership
-    owner_type = Column(String(50), nullable=True, index=True,
+    owner_type = Column(OwnerKind, nullable=True, index=True,
                         comment="Owner type: 'organization'|'user'|None")
     owner_id = Column(UUID(as_uuid=True), nullable=True, index=True,
                       comment="Owner ID")
@@ -313,12 +318,19 @@ class Company(Base):
                            comment="Up to 5 custom fields {key: value}")
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
     dialogs = relationship("Dialog", back_populates="company")
 
+    __table_args__ = (
+        # Append-only timestamp: BRIN instead of b-tree
+        Index('ix_companies_created_at', 'created_at',
+              postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
+    )
+
 
 class CsvImportMapping(Base):
     """
@@ -330,7 +342,7 @@ class CsvImportMapping(Base):
     __tablename__ = "csv_import_mappings"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    owner_type = Column(String(50), nullable=True, index=True)
+    owner_type = Column(OwnerKind, nullable=True, index=True)
     owner_id = Column(UUID(as_uuid=True), nullable=True, index=True)
     name = Column(String(255), nullable=False,
                   comment="Mapping name (e.g. 'Из 1С-Бухгалтерии')")
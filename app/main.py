@@ -74,7 +74,7 @@ from .config import get_settings
 # Auth imports
 from .auth.dependencies import require_auth, get_token_from_header, get_current_organization, OrganizationContext
 from .auth.service import AuthService
-from .auth.models import User, Membership
+from .auth.models import User, Membership, warm_dummy_hash
 
 # Get settings instance
 settings = get_settings()
@@ -217,6 +217,9 @@ async def startup_event() -> None:
         logger.error(f"Failed to initialize database: {e}")
         # Continue without database for now
 
+    if settings.auth_enabled:
+        await warm_dummy_hash()
+
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
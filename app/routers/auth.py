@@ -21,7 +21,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database.connection import get_db
 from ..config import settings, AUTH_ENABLED
-from ..auth.service import AuthService
+from ..auth.service import AuthService, TokenTypeError
+from ..auth.cache import auth_cache
 from ..auth.organizations import OrganizationsService, UserAlreadyExistsError
 from ..auth.dependencies import get_token_from_header, require_auth, get_optional_user
 from ..auth.models import User
@@ -349,17 +350,10 @@ async def logout(
 
     try:
         # Get JTI from token
-        payload = auth_service.decode_token(token)
-        jti = payload.get("jti")
-
-        if not jti:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail={"error": "invalid_token", "detail": "Token missing JTI"}
-            )
+        payload = auth_service.decode_token(token, "access")
 
         # Revoke session
-        await auth_service.logout(jti)
+        await auth_service.logout(payload["jti"])
 
         return {"message": "Successfully logged out"}
 
@@ -395,16 +389,9 @@ async def refresh(
 
     try:
         # Decode refresh token to get JTI
-        payload = auth_service.decode_token(data.refresh_token)
+        payload = auth_service.decode_token(data.refresh_token, "refresh")
 
-        if not auth_service.verify_token_type(payload, "refresh"):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail={"error": "invalid_token_type", "detail": "Expected refresh token"}
-            )
-
-        refresh_jti = payload.get("jti")
-        result = await auth_service.refresh_tokens(refresh_jti)
+        result = await auth_service.refresh_tokens(payload["jti"])
 
         if not result:
             raise HTTPException(
@@ -421,6 +408,11 @@ async def refresh(
             expires_in=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
         )
 
+    except TokenTypeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={"error": "invalid_token_type", "detail": str(e)}
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -536,8 +528,8 @@ async def select_organization(
 
     try:
         # Get current JTI
-        payload = auth_service.decode_token(token)
-        current_jti = payload.get("jti")
+        payload = auth_service.decode_token(token, "access")
+        current_jti = payload["jti"]
 
         # Switch organization
         new_session = await auth_service.switch_organization(
@@ -581,11 +573,14 @@ async def update_profile(
     if payload.new_password:
         if not payload.current_password:
             raise HTTPException(status_code=400, detail="Укажите текущий пароль")
-        if not user.verify_password(payload.current_password):
+        # password_hash is deferred and not part of the auth context load
+        await user.awaitable_attrs.password_hash
+        if not await user.verify_password_async(payload.current_password):
             raise HTTPException(status_code=400, detail="Неверный текущий пароль")
-        user.set_password(payload.new_password)
+        await user.set_password_async(payload.new_password)
 
     await db.commit()
+    auth_cache.invalidate(user_id=user.id)
     await db.refresh(user)
     return UserResponse(
         id=str(user.id),
@@ -0,0 +1,76 @@
+"""
+Shared test fixtures and helpers.
+
+Database-backed tests run against the PostgreSQL database given in
+TEST_DATABASE_URL (postgresql+asyncpg://...) and are skipped when it is
+not set. The schema is created from the models and dropped afterwards,
+so point it at a disposable database.
+"""
+
+import contextlib
+import os
+from typing import Iterator, List
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from app.database.models import Base
+import app.auth.models  # noqa: F401 - register auth tables on Base.metadata
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@contextlib.contextmanager
+def count_queries(engine: AsyncEngine) -> Iterator[List[str]]:
+    """
+    Collect every SQL statement executed on an engine.
+
+    Usage:
+        with count_queries(engine) as queries:
+            await service.list_departments(org_id)
+        assert len(queries) == 1
+
+    Args:
+        engine: Async engine to instrument
+
+    Yields:
+        List that receives each executed statement
+    """
+    queries: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest_asyncio.fixture
+async def db_engine():
+    """Async engine on a freshly created schema."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db_session(db_engine):
+    """Async session bound to the test engine."""
+    async with AsyncSession(db_engine, expire_on_commit=False) as session:
+        yield session
@@ -0,0 +1,101 @@
+"""
+Query-count regression tests for the auth hot paths.
+
+Each test pins the number of SQL statements an operation issues, so a
+reintroduced N+1 or per-request re-query fails loudly. Requires
+TEST_DATABASE_URL (see conftest.py).
+"""
+
+import pytest
+
+from app.auth.departments import DepartmentsService
+from app.auth.dependencies import _get_user_from_token
+from app.auth.models import UserRole
+from app.auth.organizations import OrganizationsService
+from app.auth.service import AuthService
+from app.tests.conftest import count_queries
+
+
+async def _seed_organization(db):
+    """Create an owner with an organization, two departments and a member."""
+    auth_service = AuthService(db)
+    org_service = OrganizationsService(db)
+
+    owner = await auth_service.create_user(
+        password="securepass123", full_name="Owner", email="owner@example.com"
+    )
+    organization = await org_service.create_organization("Acme", owner.id)
+    member = await org_service.create_and_add_user(
+        organization_id=organization.id,
+        username="member",
+        password="securepass123",
+        full_name="Member",
+        role=UserRole.MEMBER.value
+    )
+
+    dept_service = DepartmentsService(db)
+    sales = await dept_service.create_department(organization.id, "Sales", owner.id)
+    await dept_service.create_department(organization.id, "Support")
+    await dept_service.assign_member(sales.id, member.id, organization.id)
+
+    return owner, organization, sales
+
+
+@pytest.mark.asyncio
+async def test_list_departments_is_single_query(db_engine, db_session):
+    """Departments, head names and member counts come back in one query."""
+    _, organization, _ = await _seed_organization(db_session)
+
+    with count_queries(db_engine) as queries:
+        departments = await DepartmentsService(db_session).list_departments(organization.id)
+
+    assert len(queries) == 1
+    assert [d["name"] for d in departments] == ["Sales", "Support"]
+    assert departments[0]["head_user_name"] == "Owner"
+    assert departments[0]["member_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_token_resolution_is_single_query(db_engine, db_session):
+    """User, session and org membership are resolved with one query."""
+    owner, organization, _ = await _seed_organization(db_session)
+    session = await AuthService(db_session).create_session(owner.id, organization.id)
+
+    with count_queries(db_engine) as queries:
+        auth = await _get_user_from_token(session.access_token, db_session)
+
+    assert len(queries) == 1
+    user, organization_id, org_ctx = auth
+    assert user.id == owner.id
+    assert organization_id == organization.id
+    assert org_ctx.role == UserRole.OWNER
+
+
+@pytest.mark.asyncio
+async def test_delete_department_is_single_statement(db_engine, db_session):
+    """Soft delete and member unlink run as a single statement."""
+    _, organization, sales = await _seed_organization(db_session)
+    dept_service = DepartmentsService(db_session)
+
+    with count_queries(db_engine) as queries:
+        assert await dept_service.delete_department(sales.id)
+
+    assert len(queries) == 1
+
+    departments = await dept_service.list_departments(organization.id)
+    assert [d["name"] for d in departments] == ["Support"]
+
+
+@pytest.mark.asyncio
+async def test_organization_members_is_single_query(db_engine, db_session):
+    """Members and their memberships are listed with one query."""
+    owner, organization, _ = await _seed_organization(db_session)
+
+    with count_queries(db_engine) as queries:
+        members = await OrganizationsService(db_session).get_organization_members(organization.id)
+        names = sorted(user.full_name for user, _ in members)
+        roles = sorted(membership.role for _, membership in members)
+
+    assert len(queries) == 1
+    assert names == ["Member", "Owner"]
+    assert roles == [UserRole.MEMBER.value, UserRole.OWNER.value]
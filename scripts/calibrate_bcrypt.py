@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Pick a BCRYPT_ROUNDS value for the current host.
+
+Times one bcrypt check per cost factor and reports the highest cost whose
+check stays within the target, so every login pays a known, bounded
+price on the deployment hardware.
+
+Usage:
+    python scripts/calibrate_bcrypt.py [target_ms]   # default 250
+"""
+
+import sys
+import time
+
+import bcrypt
+
+MIN_ROUNDS = 10
+MAX_ROUNDS = 16
+
+
+def time_check(rounds: int) -> float:
+    """Return the duration of one bcrypt check at the given cost, in ms."""
+    password_hash = bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds))
+    start = time.perf_counter()
+    bcrypt.checkpw(b"calibration", password_hash)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    target_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 250.0
+    chosen = MIN_ROUNDS
+
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        elapsed = time_check(rounds)
+        print(f"rounds={rounds:2d}  {elapsed:8.1f} ms")
+        if elapsed > target_ms:
+            break
+        chosen = rounds
+
+    print(f"\nBCRYPT_ROUNDS={chosen}  (target {target_ms:.0f} ms per check)")
+
+
+if __name__ == "__main__":
+    main()